@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import time
+
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import Platform
 from homeassistant.core import HomeAssistant
@@ -13,12 +15,15 @@ from .const import (
     CONF_END_ENTITY,
     CONF_ENTITIES,
     CONF_PRESENCE_ENTITY,
+    CONF_START_ENTITY,
     CONF_TEMP_ENTITY,
     CONF_WEATHER_ENTITY,
     DOMAIN,
     _LOGGER,
 )
 from .coordinator import AdaptiveDataUpdateCoordinator
+from .persistence import RuntimeStore
+from .sun_dispatcher import get_sun_dispatcher
 
 PLATFORMS = [Platform.SENSOR, Platform.SWITCH, Platform.BINARY_SENSOR, Platform.BUTTON]
 CONF_SUN = ["sun.sun"]
@@ -35,7 +40,7 @@ async def async_initialize_integration(
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up Adaptive Cover from a config entry."""
-
+    setup_started = time.monotonic()
     hass.data.setdefault(DOMAIN, {})
 
     coordinator = AdaptiveDataUpdateCoordinator(hass)
@@ -43,14 +48,28 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     _presence_entity = entry.options.get(CONF_PRESENCE_ENTITY)
     _weather_entity = entry.options.get(CONF_WEATHER_ENTITY)
     _cover_entities = entry.options.get(CONF_ENTITIES, [])
+    _start_time_entity = entry.options.get(CONF_START_ENTITY)
     _end_time_entity = entry.options.get(CONF_END_ENTITY)
-    _entities = ["sun.sun"]
-    for entity in [_temp_entity, _presence_entity, _weather_entity, _end_time_entity]:
+    _entities = []
+    for entity in [
+        _temp_entity,
+        _presence_entity,
+        _weather_entity,
+        _start_time_entity,
+        _end_time_entity,
+    ]:
         if entity is not None:
             _entities.append(entity)
 
     _LOGGER.debug("Setting up entry %s", entry.data.get("name"))
 
+    # sun.sun updates are dispatched to all entries by a single listener
+    entry.async_on_unload(
+        get_sun_dispatcher(hass).async_subscribe(
+            entry.entry_id, coordinator.async_sun_update
+        )
+    )
+
     entry.async_on_unload(
         async_track_state_change_event(
             hass,
@@ -67,10 +86,13 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         )
     )
 
-    await coordinator.async_config_entry_first_refresh()
+    await coordinator.async_restore()
     hass.data[DOMAIN][entry.entry_id] = coordinator
 
+    # entities start from the restored state, or unavailable without one, the
+    # first state is computed in the background
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+    coordinator.async_schedule_startup(setup_started)
 
     entry.async_on_unload(entry.add_update_listener(_async_update_listener))
     return True
@@ -84,6 +106,11 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     return unload_ok
 
 
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Remove the runtime state of a removed config entry."""
+    await RuntimeStore(hass, entry.entry_id).async_remove()
+
+
 async def _async_update_listener(hass: HomeAssistant, entry: ConfigEntry) -> None:
     """Handle options update."""
     await hass.config_entries.async_reload(entry.entry_id)
@@ -10,13 +10,15 @@ from homeassistant.components.binary_sensor import (
     BinarySensorEntity,
 )
 from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import STATE_OFF, STATE_ON
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
+from homeassistant.helpers.restore_state import RestoreEntity
 
 from .const import CONF_SENSOR_TYPE, DOMAIN
 from .coordinator import AdaptiveDataUpdateCoordinator
+from .restore import RestoredCoordinatorEntity
 
 
 async def async_setup_entry(
@@ -51,7 +53,7 @@ async def async_setup_entry(
 
 
 class AdaptiveCoverBinarySensor(
-    CoordinatorEntity[AdaptiveDataUpdateCoordinator], BinarySensorEntity
+    RestoredCoordinatorEntity, BinarySensorEntity, RestoreEntity
 ):
     """representation of a Adaptive Cover binary sensor."""
 
@@ -89,6 +91,15 @@ class AdaptiveCoverBinarySensor(
             name=self._device_name,
         )
 
+    async def async_get_restored_value(self) -> bool | None:
+        """Return the state saved before the restart."""
+        if (last := await self.async_get_last_state()) is None or last.state not in (
+            STATE_ON,
+            STATE_OFF,
+        ):
+            return None
+        return last.state == STATE_ON
+
     @property
     def name(self):
         """Name of the entity."""
@@ -97,9 +108,11 @@ class AdaptiveCoverBinarySensor(
     @property
     def is_on(self) -> bool:
         """Return true if the binary sensor is on."""
+        if self.coordinator.data is None:
+            return self._restored
         return self.coordinator.data.states[self._key]
 
     @property
     def extra_state_attributes(self) -> Mapping[str, Any] | None:  # noqa: D102
-        if self._key == "manual_override":
+        if self._key == "manual_override" and self.coordinator.data is not None:
             return {"manual_controlled": self.coordinator.data.states["manual_list"]}
@@ -79,18 +79,24 @@ class AdaptiveCoverButton(
 
     async def async_press(self) -> None:
         """Handle the button press."""
+
+        async def reset(entity):
+            _LOGGER.debug("Resetting manual override for: %s", entity)
+            if await self.coordinator.async_set_position(
+                entity, self.coordinator.state
+            ):
+                result = await self.coordinator.async_wait_for_target(entity)
+                _LOGGER.debug("Reset of %s finished: %s", entity, result)
+            self.coordinator.async_reset_manual(entity)
+
+        manual = []
         for entity in self._entities:
             if self.coordinator.manager.is_cover_manual(entity):
-                _LOGGER.debug("Resetting manual override for: %s", entity)
-                await self.coordinator.async_set_position(
-                    entity, self.coordinator.state
-                )
-                while self.coordinator.wait_for_target.get(entity):
-                    await asyncio.sleep(1)
-                self.coordinator.manager.reset(entity)
+                manual.append(entity)
             else:
                 _LOGGER.debug(
                     "Resetting manual override for %s is not needed since it is already auto-controlled",
                     entity,
                 )
+        await asyncio.gather(*(reset(entity) for entity in manual))
         await self.coordinator.async_refresh()
@@ -2,22 +2,29 @@
 
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
-from datetime import datetime, timedelta
+from datetime import UTC, date, datetime, timedelta
+import math
 
 import numpy as np
-import pandas as pd
 from homeassistant.core import HomeAssistant
 from numpy import cos, sin, tan
 from numpy import radians as rad
 
-from .helpers import get_domain, get_safe_state
+from .const import TIMELINE_RESOLUTION
+from .helpers import get_domain
+from .snapshot import EntitySnapshot
+from .solar import to_utc_seconds
 from .sun import SunData
 from .config_context_adapter import ConfigContextAdapter
 
 
-@dataclass
+@dataclass(slots=True)
 class AdaptiveGeneralCover(ABC):
-    """Collect common data."""
+    """Collect common data.
+
+    Instances are compiled once per options version; only `sol_azi` and
+    `sol_elev` change afterwards, so derived constants are computed upfront.
+    """
 
     hass: HomeAssistant
     logger: ConfigContextAdapter
@@ -42,34 +49,162 @@ class AdaptiveGeneralCover(ABC):
     min_elevation: int
     max_elevation: int
     sun_data: SunData = field(init=False)
+    azi_min_abs: int = field(init=False)
+    azi_max_abs: int = field(init=False)
+    fov_left_clipped: int = field(init=False)
+    fov_right_clipped: int = field(init=False)
+    blind_spot_edges: tuple[int, int] | None = field(init=False)
+    _sunset_window: tuple[date, datetime, datetime] | None = field(init=False)
 
     def __post_init__(self):
-        """Add solar data to dataset."""
+        """Add solar data to dataset and precompute derived constants."""
         self.sun_data = SunData(self.timezone, self.hass)
+        self.azi_min_abs = (self.win_azi - self.fov_left + 360) % 360
+        self.azi_max_abs = (self.win_azi + self.fov_right + 360) % 360
+        # sun positions behind the window plane are never valid
+        self.fov_left_clipped = min(self.fov_left, 90)
+        self.fov_right_clipped = min(self.fov_right, 90)
+        self._sunset_window = None
+        self.blind_spot_edges = None
+        if (
+            self.blind_spot_left is not None
+            and self.blind_spot_right is not None
+            and self.blind_spot_on
+        ):
+            self.blind_spot_edges = (
+                self.fov_left - self.blind_spot_left,
+                self.fov_left - self.blind_spot_right,
+            )
 
     def solar_times(self):
         """Determine start/end times."""
-        df_today = pd.DataFrame(
-            {
-                "azimuth": self.sun_data.solar_azimuth,
-                "elevation": self.sun_data.solar_elevation,
-            }
+        intervals = self.sun_data.intervals(self.fov_mask)
+        if not intervals:
+            return None, None
+        return intervals[0][0], intervals[-1][1]
+
+    def sun_edges(self) -> list[datetime]:
+        """Get the moments today where the sun enters or leaves the window."""
+        edges = set()
+        for mask in (self.valid_mask, self.direct_sun_mask):
+            for start, end in self.sun_data.intervals(mask):
+                edges.update((start, end))
+        return sorted(edges)
+
+    def fov_mask(self, azimuth: np.ndarray, elevation: np.ndarray) -> np.ndarray:
+        """Check which sun positions are within the field of view."""
+        return (
+            (azimuth - self.azi_min_abs) % 360
+            <= (self.azi_max_abs - self.azi_min_abs) % 360
+        ) & (elevation > 0)
+
+    def gamma_array(self, azimuth: np.ndarray) -> np.ndarray:
+        """Calculate gamma for an array of sun azimuths."""
+        return (self.win_azi - azimuth + 180) % 360 - 180
+
+    def valid_elevation_mask(self, elevation: np.ndarray) -> np.ndarray:
+        """Check which sun elevations are within range."""
+        if self.min_elevation is None and self.max_elevation is None:
+            return elevation >= 0
+        if self.min_elevation is None:
+            return elevation <= self.max_elevation
+        if self.max_elevation is None:
+            return elevation >= self.min_elevation
+        return (elevation >= self.min_elevation) & (elevation <= self.max_elevation)
+
+    def valid_mask(self, azimuth: np.ndarray, elevation: np.ndarray) -> np.ndarray:
+        """Vectorized version of `valid` for arrays of sun positions."""
+        gamma = self.gamma_array(azimuth)
+        return (
+            (gamma < self.fov_left_clipped)
+            & (gamma > -self.fov_right_clipped)
+            & self.valid_elevation_mask(elevation)
         )
-        solpos = df_today.set_index(self.sun_data.times)
 
-        alpha = solpos["azimuth"]
-        frame = (
-            (alpha - self.azi_min_abs) % 360
-            <= (self.azi_max_abs - self.azi_min_abs) % 360
-        ) & (solpos["elevation"] > 0)
+    def blind_spot_mask(self, azimuth: np.ndarray, elevation: np.ndarray) -> np.ndarray:
+        """Vectorized version of `is_sun_in_blind_spot`."""
+        if self.blind_spot_edges is None:
+            return np.zeros(np.shape(azimuth), dtype=bool)
+        left_edge, right_edge = self.blind_spot_edges
+        gamma = self.gamma_array(azimuth)
+        blindspot = (gamma <= left_edge) & (gamma >= right_edge)
+        if self.blind_spot_elevation is not None:
+            blindspot = blindspot & (elevation <= self.blind_spot_elevation)
+        return blindspot
+
+    def direct_sun_mask(self, azimuth: np.ndarray, elevation: np.ndarray) -> np.ndarray:
+        """Check which sun positions are in the window and not in the blind spot."""
+        return self.valid_mask(azimuth, elevation) & ~self.blind_spot_mask(
+            azimuth, elevation
+        )
 
-        if solpos[frame].empty:
-            return None, None
-        else:
-            return (
-                solpos[frame].index[0].to_pydatetime(),
-                solpos[frame].index[-1].to_pydatetime(),
-            )
+    def sunset_mask(self, times) -> np.ndarray:
+        """Vectorized version of `sunset_valid` for an array of timestamps."""
+        seconds = to_utc_seconds(times)
+        sunrise, sunset = self.sunset_window
+        return (seconds > sunset.timestamp()) | (seconds < sunrise.timestamp())
+
+    def batch(self, azimuth, elevation, times) -> "CoverProfile":
+        """Calculate positions and states for arrays of sun positions.
+
+        Mirrors `NormalCoverState.get_state` element-wise: `times` is used
+        for the sunset check, `azimuth` and `elevation` for the geometry.
+        """
+        azimuth = np.asarray(azimuth, dtype=np.float64)
+        elevation = np.asarray(elevation, dtype=np.float64)
+        with np.errstate(all="ignore"):
+            position = self.position_array(azimuth, elevation)
+            percentage = self.percentage_array(azimuth, elevation)
+
+        sunset = self.sunset_mask(times)
+        valid = self.valid_mask(azimuth, elevation)
+        direct_sun = valid & ~self.blind_spot_mask(azimuth, elevation) & ~sunset
+        default = np.where(sunset, self.sunset_pos, self.h_def)
+        state = np.clip(np.where(direct_sun, percentage, default), 0, 100)
+
+        clamp = np.zeros(state.shape, dtype=np.int8)
+        if self.max_pos is not None and self.max_pos != 100:
+            max_applied = state > self.max_pos
+            if self.max_pos_bool:
+                max_applied &= direct_sun
+            state = np.where(max_applied, self.max_pos, state)
+            clamp[max_applied] = CLAMP_MAX
+        if self.min_pos is not None and self.min_pos != 0:
+            min_applied = (clamp == CLAMP_NONE) & (state < self.min_pos)
+            if self.min_pos_bool:
+                min_applied &= direct_sun
+            state = np.where(min_applied, self.min_pos, state)
+            clamp[min_applied] = CLAMP_MIN
+
+        return CoverProfile(
+            times=times,
+            position=position,
+            percentage=percentage,
+            state=state,
+            valid=valid,
+            direct_sun=direct_sun,
+            sunset=sunset,
+            clamp=clamp,
+        )
+
+    def timeline(self, step: float = TIMELINE_RESOLUTION) -> "PositionTimeline":
+        """Precompute today's normal cover state every `step` seconds."""
+        grid = to_utc_seconds(self.sun_data.times)
+        seconds = np.arange(grid[0], grid[-1] + 1, step, dtype=np.float64)
+        azimuth, elevation = self.sun_data.position_at(seconds)
+        profile = self.batch(azimuth, elevation, seconds)
+        state = np.round(profile.state)
+        state.flags.writeable = False
+        return PositionTimeline(
+            day=date.today(),
+            start=float(seconds[0]),
+            step=float(step),
+            state=state,
+            valid=profile.valid,
+            direct_sun=profile.direct_sun,
+            sunset=profile.sunset,
+            clamp=profile.clamp,
+        )
 
     @property
     def _get_azimuth_edges(self) -> tuple[int, int]:
@@ -79,75 +214,50 @@ class AdaptiveGeneralCover(ABC):
     @property
     def is_sun_in_blind_spot(self) -> bool:
         """Check if sun is in blind spot."""
-        if (
-            self.blind_spot_left is not None
-            and self.blind_spot_right is not None
-            and self.blind_spot_on
-        ):
-            left_edge = self.fov_left - self.blind_spot_left
-            right_edge = self.fov_left - self.blind_spot_right
-            blindspot = (self.gamma <= left_edge) & (self.gamma >= right_edge)
-            if self.blind_spot_elevation is not None:
-                blindspot = blindspot & (self.sol_elev <= self.blind_spot_elevation)
-            self.logger.debug("Is sun in blind spot? %s", blindspot)
-            return blindspot
-        return False
-
-    @property
-    def azi_min_abs(self) -> int:
-        """Calculate min azimuth."""
-        azi_min_abs = (self.win_azi - self.fov_left + 360) % 360
-        return azi_min_abs
-
-    @property
-    def azi_max_abs(self) -> int:
-        """Calculate max azimuth."""
-        azi_max_abs = (self.win_azi + self.fov_right + 360) % 360
-        return azi_max_abs
+        blindspot = bool(self.blind_spot_mask(self.sol_azi, self.sol_elev))
+        self.logger.debug("Is sun in blind spot? %s", blindspot)
+        return blindspot
 
     @property
     def gamma(self) -> float:
         """Calculate Gamma."""
         # surface solar azimuth
-        gamma = (self.win_azi - self.sol_azi + 180) % 360 - 180
-        return gamma
+        return self.gamma_array(self.sol_azi)
 
     @property
     def valid_elevation(self) -> bool:
         """Check if elevation is within range."""
-        if self.min_elevation is None and self.max_elevation is None:
-            return self.sol_elev >= 0
-        if self.min_elevation is None:
-            return self.sol_elev <= self.max_elevation
-        if self.max_elevation is None:
-            return self.sol_elev >= self.min_elevation
-        within_range = self.min_elevation <= self.sol_elev <= self.max_elevation
+        within_range = bool(self.valid_elevation_mask(self.sol_elev))
         self.logger.debug("elevation within range? %s", within_range)
         return within_range
 
     @property
     def valid(self) -> bool:
         """Determine if sun is in front of window."""
-        # clip azi_min and azi_max to 90
-        azi_min = min(self.fov_left, 90)
-        azi_max = min(self.fov_right, 90)
-
         # valid sun positions are those within the blind's azimuth range and above the horizon (FOV)
-        valid = (
-            (self.gamma < azi_min) & (self.gamma > -azi_max) & (self.valid_elevation)
-        )
+        valid = bool(self.valid_mask(self.sol_azi, self.sol_elev))
         self.logger.debug("Sun in front of window (ignoring blindspot)? %s", valid)
         return valid
 
+    @property
+    def sunset_window(self) -> tuple[datetime, datetime]:
+        """Get today's sunrise and sunset including their offsets."""
+        today = date.today()
+        if self._sunset_window is None or self._sunset_window[0] != today:
+            self._sunset_window = (
+                today,
+                self.sun_data.sunrise() + timedelta(minutes=self.sunrise_off),
+                self.sun_data.sunset() + timedelta(minutes=self.sunset_off),
+            )
+        return self._sunset_window[1:]
+
     @property
     def sunset_valid(self) -> bool:
         """Determine if it is after sunset plus offset."""
-        sunset = self.sun_data.sunset().replace(tzinfo=None)
-        sunrise = self.sun_data.sunrise().replace(tzinfo=None)
-        after_sunset = datetime.utcnow() > (sunset + timedelta(minutes=self.sunset_off))
-        before_sunrise = datetime.utcnow() < (
-            sunrise + timedelta(minutes=self.sunrise_off)
-        )
+        sunrise, sunset = self.sunset_window
+        now = datetime.now(UTC)
+        after_sunset = now > sunset
+        before_sunrise = now < sunrise
         self.logger.debug(
             "After sunset plus offset? %s", (after_sunset or before_sunrise)
         )
@@ -188,6 +298,16 @@ class AdaptiveGeneralCover(ABC):
         """Check if sun is directly in front of window."""
         return (self.valid) & (not self.sunset_valid) & (not self.is_sun_in_blind_spot)
 
+    @abstractmethod
+    def position_array(self, azimuth: np.ndarray, elevation: np.ndarray) -> np.ndarray:
+        """Calculate the position of the blind for arrays of sun positions."""
+
+    @abstractmethod
+    def percentage_array(
+        self, azimuth: np.ndarray, elevation: np.ndarray
+    ) -> np.ndarray:
+        """Calculate percentages for arrays of sun positions."""
+
     @abstractmethod
     def calculate_position(self) -> float:
         """Calculate the position of the blind."""
@@ -197,11 +317,129 @@ class AdaptiveGeneralCover(ABC):
         """Calculate percentage from position."""
 
 
+CLAMP_NONE = 0
+CLAMP_MAX = 1
+CLAMP_MIN = 2
+CLAMP_NAMES = (None, "max", "min")
+
+
+@dataclass(frozen=True)
+class CoverProfile:
+    """Cover positions for a batch of sun positions."""
+
+    times: np.ndarray
+    position: np.ndarray
+    percentage: np.ndarray
+    state: np.ndarray
+    valid: np.ndarray
+    direct_sun: np.ndarray
+    sunset: np.ndarray
+    clamp: np.ndarray
+
+
+@dataclass(frozen=True)
+class PositionTimeline:
+    """Normal cover state of one day on a regular time grid.
+
+    The state only depends on the time of day for a given configuration, so
+    it is computed once and looked up by index on every refresh.
+    """
+
+    day: date
+    start: float
+    step: float
+    state: np.ndarray
+    valid: np.ndarray
+    direct_sun: np.ndarray
+    sunset: np.ndarray
+    clamp: np.ndarray
+
+    def index(self, when: datetime) -> int | None:
+        """Return the grid index of the last sample at or before a moment.
+
+        Samples hold until the next one, a tiny tolerance keeps moments on
+        the grid from flooring to the previous sample.
+        """
+        index = math.floor((when.timestamp() - self.start) / self.step + 1e-9)
+        if 0 <= index < len(self.state):
+            return index
+        return None
+
+    def time(self, index: int) -> datetime:
+        """Return the moment of a grid index."""
+        return datetime.fromtimestamp(self.start + index * self.step, UTC)
+
+    def state_at(self, when: datetime) -> int | None:
+        """Look up the normal cover state at a moment."""
+        index = self.index(when)
+        return None if index is None else int(self.state[index])
+
+    def valid_at(self, when: datetime) -> bool | None:
+        """Look up if the sun is in front of the window at a moment."""
+        index = self.index(when)
+        return None if index is None else bool(self.valid[index])
+
+    def decision(self, index: int) -> tuple[str, str | None]:
+        """Return the branch and clamp of the normal state at a grid index."""
+        if self.direct_sun[index]:
+            branch = "sun_in_window"
+        elif self.sunset[index]:
+            branch = "sunset"
+        else:
+            branch = "default"
+        return branch, CLAMP_NAMES[self.clamp[index]]
+
+    def next_change(
+        self,
+        after: datetime,
+        reference: int,
+        min_change: float,
+        always: tuple[int | None, ...] = (),
+    ) -> datetime | None:
+        """Return the first moment after `after` that needs a refresh.
+
+        That is when the state moved at least `min_change` away from
+        `reference`, reaches one of the `always` states, or when the sun
+        enters or leaves the window or the sunset period starts or ends.
+        Returns the end of the day if nothing changes, None if `after` is
+        not on this day.
+        """
+        first = self.index(after)
+        if first is None:
+            return None
+        state = self.state[first + 1 :]
+        hits = np.flatnonzero(
+            (np.abs(state - reference) >= min_change)
+            | (
+                np.isin(state, [s for s in always if s is not None])
+                & (state != reference)
+            )
+            | (self.valid[first + 1 :] != self.valid[first])
+            | (self.direct_sun[first + 1 :] != self.direct_sun[first])
+            | (self.sunset[first + 1 :] != self.sunset[first])
+        )
+        if len(hits) == 0:
+            return self.time(len(self.state))
+        return self.time(first + 1 + int(hits[0]))
+
+    def changes(self, after: datetime) -> list[tuple[datetime, int]]:
+        """List the upcoming moments where the state changes."""
+        first = self.index(after)
+        if first is None:
+            return []
+        state = self.state[first:]
+        indices = np.flatnonzero(state[1:] != state[:-1]) + first + 1
+        return [(self.time(index), int(self.state[index])) for index in indices]
+
+
 @dataclass
 class NormalCoverState:
     """Compute state for normal operation."""
 
     cover: AdaptiveGeneralCover
+    # branch and clamp of the last evaluation, for the decision trace
+    branch: str | None = field(default=None, init=False)
+    clamp: str | None = field(default=None, init=False)
 
     def get_state(self) -> int:
         """Return state."""
@@ -212,22 +450,27 @@ class NormalCoverState:
         )
         if dsv:
             state = self.cover.calculate_percentage()
+            self.branch = "sun_in_window"
             self.cover.logger.debug(
                 "Yes sun in window: using calculated percentage (%s)", state
             )
         else:
             state = self.cover.default
+            self.branch = "sunset" if self.cover.sunset_valid else "default"
             self.cover.logger.debug("No sun in window: using default value (%s)", state)
 
-        result = np.clip(state, 0, 100)
+        self.clamp = None
+        result = min(max(state, 0), 100)
         if self.cover.apply_max_position and result > self.cover.max_pos:
+            self.clamp = "max"
             return self.cover.max_pos
         if self.cover.apply_min_position and result < self.cover.min_pos:
+            self.clamp = "min"
             return self.cover.min_pos
         return result
 
 
-@dataclass
+@dataclass(slots=True)
 class ClimateCoverData:
     """Fetch additional data."""
 
@@ -250,42 +493,64 @@ class ClimateCoverData:
     temp_summer_outside: float
     _use_lux: bool
     _use_irradiance: bool
+    snapshot: EntitySnapshot | None = None
+
+    def __post_init__(self):
+        """Read the entity states if no snapshot is given."""
+        if self.snapshot is None:
+            self.snapshot = EntitySnapshot.capture(self.hass, self.entity_ids)
+
+    @property
+    def entity_ids(self) -> list[str | None]:
+        """Entities read by the climate logic."""
+        return [
+            self.temp_entity,
+            self.presence_entity,
+            self.weather_entity,
+            self.outside_entity,
+            self.lux_entity,
+            self.irradiance_entity,
+        ]
+
+    @property
+    def inputs(self) -> dict:
+        """Raw climate inputs of the current snapshot."""
+        return {
+            "temperature": self.get_current_temperature,
+            "outside_temperature": self.outside_temperature,
+            "presence": self.is_presence,
+            "weather": self.snapshot.safe_state(self.weather_entity),
+            "lux": self.snapshot.number(self.lux_entity),
+            "irradiance": self.snapshot.number(self.irradiance_entity),
+        }
 
     @property
-    def outside_temperature(self):
+    def outside_temperature(self) -> float | None:
         """Get outside temperature."""
         temp = None
         if self.outside_entity:
-            temp = get_safe_state(
-                self.hass,
-                self.outside_entity,
-            )
+            temp = self.snapshot.number(self.outside_entity)
         elif self.weather_entity:
-            state = self.hass.states.get(self.weather_entity)
-            temp = state.attributes.get("temperature") if state else None
+            temp = self.snapshot.attribute(self.weather_entity, "temperature")
         return temp
 
     @property
-    def inside_temperature(self):
+    def inside_temperature(self) -> float | None:
         """Get inside temp from entity."""
         if self.temp_entity is not None:
             if get_domain(self.temp_entity) != "climate":
-                temp = get_safe_state(
-                    self.hass,
-                    self.temp_entity,
-                )
+                temp = self.snapshot.number(self.temp_entity)
             else:
-                state = self.hass.states.get(self.temp_entity)
-                temp = state.attributes.get("current_temperature") if state else None
+                temp = self.snapshot.attribute(self.temp_entity, "current_temperature")
             return temp
 
     @property
     def get_current_temperature(self) -> float:
         """Get temperature."""
         if self.temp_switch:
-            if self.outside_temperature:
+            if self.outside_temperature is not None:
                 return float(self.outside_temperature)
-        if self.inside_temperature:
+        if self.inside_temperature is not None:
             return float(self.inside_temperature)
 
     @property
@@ -293,7 +558,7 @@ class ClimateCoverData:
         """Checks if people are present."""
         presence = None
         if self.presence_entity is not None:
-            presence = get_safe_state(self.hass, self.presence_entity)
+            presence = self.snapshot.safe_state(self.presence_entity)
         # set to true if no sensor is defined
         if presence is not None:
             domain = get_domain(self.presence_entity)
@@ -308,14 +573,15 @@ class ClimateCoverData:
     @property
     def is_winter(self) -> bool:
         """Check if temperature is below threshold."""
-        if self.temp_low is not None and self.get_current_temperature is not None:
-            is_it = self.get_current_temperature < self.temp_low
+        temperature = self.get_current_temperature
+        if self.temp_low is not None and temperature is not None:
+            is_it = temperature < self.temp_low
         else:
             is_it = False
 
         self.logger.debug(
             "is_winter(): current_temperature < temp_low: %s < %s = %s",
-            self.get_current_temperature,
+            temperature,
             self.temp_low,
             is_it,
         )
@@ -334,16 +600,18 @@ class ClimateCoverData:
     @property
     def is_summer(self) -> bool:
         """Check if temperature is over threshold."""
-        if self.temp_high is not None and self.get_current_temperature is not None:
-            is_it = self.get_current_temperature > self.temp_high and self.outside_high
+        temperature = self.get_current_temperature
+        outside_high = self.outside_high
+        if self.temp_high is not None and temperature is not None:
+            is_it = temperature > self.temp_high and outside_high
         else:
             is_it = False
 
         self.logger.debug(
             "is_summer(): current_temp > temp_high and outside_high?: %s > %s and %s = %s",
-            self.get_current_temperature,
+            temperature,
             self.temp_high,
-            self.outside_high,
+            outside_high,
             is_it,
         )
         return is_it
@@ -353,7 +621,7 @@ class ClimateCoverData:
         """Check if condition can contain radiation in winter."""
         weather_state = None
         if self.weather_entity is not None:
-            weather_state = get_safe_state(self.hass, self.weather_entity)
+            weather_state = self.snapshot.safe_state(self.weather_entity)
         else:
             self.logger.debug("is_sunny(): No weather entity defined")
             return True
@@ -368,10 +636,10 @@ class ClimateCoverData:
         if not self._use_lux:
             return False
         if self.lux_entity is not None and self.lux_threshold is not None:
-            value = get_safe_state(self.hass, self.lux_entity)
+            value = self.snapshot.number(self.lux_entity)
             if value is None:
                 return False
-            return float(value) <= self.lux_threshold
+            return value <= self.lux_threshold
         return False
 
     @property
@@ -380,10 +648,10 @@ class ClimateCoverData:
         if not self._use_irradiance:
             return False
         if self.irradiance_entity is not None and self.irradiance_threshold is not None:
-            value = get_safe_state(self.hass, self.irradiance_entity)
+            value = self.snapshot.number(self.irradiance_entity)
             if value is None:
                 return False
-            return float(value) <= self.irradiance_threshold
+            return value <= self.irradiance_threshold
         return False
 
 
@@ -392,13 +660,15 @@ class ClimateCoverState(NormalCoverState):
     """Compute state for climate control operation."""
 
     climate_data: ClimateCoverData
+    climate_branch: str | None = field(default=None, init=False)
 
     def normal_type_cover(self) -> int:
         """Determine state for horizontal and vertical covers."""
 
-        self.cover.logger.debug("Is presence? %s", self.climate_data.is_presence)
+        is_presence = self.climate_data.is_presence
+        self.cover.logger.debug("Is presence? %s", is_presence)
 
-        if self.climate_data.is_presence:
+        if is_presence:
             return self.normal_with_presence()
 
         return self.normal_without_presence()
@@ -419,28 +689,35 @@ class ClimateCoverState(NormalCoverState):
                 self.cover.logger.debug(
                     "n_w_p(): Winter and sun is in front of window = use 100"
                 )
+                self.climate_branch = "presence_winter_open"
                 return 100
             # Otherwise, return the default cover state
             self.cover.logger.debug(
                 "n_w_p(): it's not summer and sunny weather is not present = use default"
             )
+            self.climate_branch = "presence_not_sunny_default"
             return self.cover.default
 
         # If it's summer and there's a transparent blind, return 0
         if is_summer and self.climate_data.transparent_blind:
+            self.climate_branch = "presence_summer_transparent"
             return 0
 
         # If none of the above conditions are met, get the state from the parent class
         self.cover.logger.debug("n_w_p(): None of the climate conditions are met")
+        self.climate_branch = "presence_normal"
         return super().get_state()
 
     def normal_without_presence(self) -> int:
         """Determine state for horizontal and vertical covers without occupants."""
         if self.cover.valid:
             if self.climate_data.is_summer:
+                self.climate_branch = "absence_summer_closed"
                 return 0
             if self.climate_data.is_winter:
+                self.climate_branch = "absence_winter_open"
                 return 100
+        self.climate_branch = "absence_default"
         return self.cover.default
 
     def tilt_with_presence(self, degrees: int) -> int:
@@ -452,8 +729,11 @@ class ClimateCoverState(NormalCoverState):
         ):
             if self.climate_data.is_summer:
                 # If it's summer, return 45 degrees
+                self.climate_branch = "tilt_presence_summer"
                 return 45 / degrees * 100
+            self.climate_branch = "tilt_presence_normal"
             return super().get_state()
+        self.climate_branch = "tilt_presence_default"
         return 80 / degrees * 100
 
     def tilt_without_presence(self, degrees: int) -> int:
@@ -462,11 +742,15 @@ class ClimateCoverState(NormalCoverState):
         if self.cover.valid:
             if self.climate_data.is_summer:
                 # block out all light in summer
+                self.climate_branch = "tilt_absence_summer_closed"
                 return 0
             if self.climate_data.is_winter and self.cover.mode == "mode2":
                 # parallel to sun beams, not possible with single direction
+                self.climate_branch = "tilt_absence_winter_parallel"
                 return (beta + 90) / degrees * 100
+            self.climate_branch = "tilt_absence_default"
             return 80 / degrees * 100
+        self.climate_branch = "tilt_absence_normal"
         return super().get_state()
 
     def tilt_state(self):
@@ -480,8 +764,10 @@ class ClimateCoverState(NormalCoverState):
 
     def get_state(self) -> int:
         """Return state."""
+        self.clamp = None
         result = self.normal_type_cover()
         if self.climate_data.blind_type == "cover_tilt":
+            self.clamp = None
             result = self.tilt_state()
         if self.cover.apply_max_position and result > self.cover.max_pos:
             self.cover.logger.debug(
@@ -489,6 +775,7 @@ class ClimateCoverState(NormalCoverState):
                 result,
                 self.cover.max_pos,
             )
+            self.clamp = "max"
             return self.cover.max_pos
         if self.cover.apply_min_position and result < self.cover.min_pos:
             self.cover.logger.debug(
@@ -496,26 +783,36 @@ class ClimateCoverState(NormalCoverState):
                 result,
                 self.cover.min_pos,
             )
+            self.clamp = "min"
             return self.cover.min_pos
         return result
 
 
-@dataclass
+@dataclass(slots=True)
 class AdaptiveVerticalCover(AdaptiveGeneralCover):
     """Calculate state for Vertical blinds."""
 
     distance: float
     h_win: float
 
-    def calculate_position(self) -> float:
-        """Calculate blind height."""
-        # calculate blind height
-        blind_height = np.clip(
-            (self.distance / cos(rad(self.gamma))) * tan(rad(self.sol_elev)),
+    def position_array(self, azimuth: np.ndarray, elevation: np.ndarray) -> np.ndarray:
+        """Calculate blind heights for arrays of sun positions."""
+        gamma = self.gamma_array(azimuth)
+        return np.clip(
+            (self.distance / cos(rad(gamma))) * tan(rad(elevation)),
             0,
             self.h_win,
         )
-        return blind_height
+
+    def percentage_array(
+        self, azimuth: np.ndarray, elevation: np.ndarray
+    ) -> np.ndarray:
+        """Convert blind heights to percentages for arrays of sun positions."""
+        return np.round(self.position_array(azimuth, elevation) / self.h_win * 100)
+
+    def calculate_position(self) -> float:
+        """Calculate blind height."""
+        return self.position_array(self.sol_azi, self.sol_elev)
 
     def calculate_percentage(self) -> float:
         """Convert blind height to percentage or default value."""
@@ -527,25 +824,37 @@ class AdaptiveVerticalCover(AdaptiveGeneralCover):
         return round(result)
 
 
-@dataclass
+@dataclass(slots=True)
 class AdaptiveHorizontalCover(AdaptiveVerticalCover):
     """Calculate state for Horizontal blinds."""
 
     awn_length: float
     awn_angle: float
 
-    def calculate_position(self) -> float:
-        """Calculate awn length from blind height."""
+    def position_array(self, azimuth: np.ndarray, elevation: np.ndarray) -> np.ndarray:
+        """Calculate awning lengths for arrays of sun positions."""
         awn_angle = 90 - self.awn_angle
-        a_angle = 90 - self.sol_elev
+        a_angle = 90 - elevation
         c_angle = 180 - awn_angle - a_angle
 
-        vertical_position = super().calculate_position()
-        length = ((self.h_win - vertical_position) * sin(rad(a_angle))) / sin(
-            rad(c_angle)
+        # slotted dataclasses do not support zero-argument super()
+        vertical_position = AdaptiveVerticalCover.position_array(
+            self, azimuth, elevation
         )
         # return np.clip(length, 0, self.awn_length)
-        return length
+        return ((self.h_win - vertical_position) * sin(rad(a_angle))) / sin(
+            rad(c_angle)
+        )
+
+    def percentage_array(
+        self, azimuth: np.ndarray, elevation: np.ndarray
+    ) -> np.ndarray:
+        """Convert awning lengths to percentages for arrays of sun positions."""
+        return np.round(self.position_array(azimuth, elevation) / self.awn_length * 100)
+
+    def calculate_position(self) -> float:
+        """Calculate awn length from blind height."""
+        return self.position_array(self.sol_azi, self.sol_elev)
 
     def calculate_percentage(self) -> float:
         """Convert awn length to percentage or default value."""
@@ -553,49 +862,55 @@ class AdaptiveHorizontalCover(AdaptiveVerticalCover):
         return round(result)
 
 
-@dataclass
+@dataclass(slots=True)
 class AdaptiveTiltCover(AdaptiveGeneralCover):
     """Calculate state for tilted blinds."""
 
     slat_distance: float
     depth: float
     mode: str
+    degrees: int = field(init=False)
+    slat_ratio: float = field(init=False)
+
+    def __post_init__(self):
+        """Precompute slat constants."""
+        AdaptiveGeneralCover.__post_init__(self)
+        # 0 degrees is closed, 90 degrees is open, 180 degrees is closed
+        self.degrees = 90 if self.mode == "mode1" else 180
+        self.slat_ratio = self.slat_distance / self.depth
+
+    def beta_array(self, azimuth: np.ndarray, elevation: np.ndarray) -> np.ndarray:
+        """Calculate beta for arrays of sun positions."""
+        return np.arctan(tan(rad(elevation)) / cos(rad(self.gamma_array(azimuth))))
 
     @property
     def beta(self):
         """Calculate beta."""
-        beta = np.arctan(tan(rad(self.sol_elev)) / cos(rad(self.gamma)))
-        return beta
+        return self.beta_array(self.sol_azi, self.sol_elev)
 
-    def calculate_position(self) -> float:
-        """Calculate position of venetian blinds.
+    def position_array(self, azimuth: np.ndarray, elevation: np.ndarray) -> np.ndarray:
+        """Calculate slat angles for arrays of sun positions.
 
         https://www.mdpi.com/1996-1073/13/7/1731
         """
-        beta = self.beta
+        beta = self.beta_array(azimuth, elevation)
 
         slat = 2 * np.arctan(
-            (
-                tan(beta)
-                + np.sqrt(
-                    (tan(beta) ** 2) - ((self.slat_distance / self.depth) ** 2) + 1
-                )
-            )
-            / (1 + self.slat_distance / self.depth)
+            (tan(beta) + np.sqrt((tan(beta) ** 2) - (self.slat_ratio**2) + 1))
+            / (1 + self.slat_ratio)
         )
-        result = np.rad2deg(slat)
+        return np.rad2deg(slat)
 
-        return result
+    def percentage_array(
+        self, azimuth: np.ndarray, elevation: np.ndarray
+    ) -> np.ndarray:
+        """Convert slat angles to percentages for arrays of sun positions."""
+        return np.round(self.position_array(azimuth, elevation) / self.degrees * 100)
+
+    def calculate_position(self) -> float:
+        """Calculate position of venetian blinds."""
+        return self.position_array(self.sol_azi, self.sol_elev)
 
     def calculate_percentage(self):
         """Convert tilt angle to percentages or default value."""
-        # 0 degrees is closed, 90 degrees is open, 180 degrees is closed
-        percentage_single = self.calculate_position() / 90 * 100  # single directional
-        percentage_bi = self.calculate_position() / 180 * 100  # bi-directional
-
-        if self.mode == "mode1":
-            percentage = percentage_single
-        else:
-            percentage = percentage_bi
-
-        return round(percentage)
+        return round(self.calculate_position() / self.degrees * 100)
@@ -0,0 +1,309 @@
+"""Rate limited queue of cover commands shared by all config entries."""
+
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass, field
+from enum import IntEnum
+import itertools
+import random
+import time
+
+from homeassistant.components.cover import DOMAIN as COVER_DOMAIN
+from homeassistant.const import ATTR_ENTITY_ID
+from homeassistant.core import HomeAssistant
+
+from .const import (
+    _LOGGER,
+    COMMAND_BURST,
+    COMMAND_CONCURRENCY,
+    COMMAND_JITTER,
+    COMMAND_RATE,
+    DATA_COMMAND_QUEUE,
+    DOMAIN,
+)
+
+
+class CommandPriority(IntEnum):
+    """Priority of a cover command, lower is sent first."""
+
+    USER = 0
+    ROUTINE = 1
+
+
+@dataclass(slots=True)
+class CoverCommand:
+    """Queued position command for one cover."""
+
+    priority: CommandPriority
+    order: int
+    entity_id: str
+    service: str
+    attribute: str
+    position: int
+    submitted: float
+    future: asyncio.Future[bool]
+    # retried on its own after the call of its batch failed
+    single: bool = False
+
+
+class TokenBucket:
+    """Allow `rate` calls per second with bursts of up to `burst` calls."""
+
+    __slots__ = ("rate", "burst", "_tokens", "_updated")
+
+    def __init__(self, rate: float, burst: float) -> None:  # noqa: D107
+        self.rate = rate
+        self.burst = burst
+        self._tokens = burst
+        self._updated = time.monotonic()
+
+    def reserve(self) -> float:
+        """Take a token, returning how long to wait before using it."""
+        now = time.monotonic()
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+        self._tokens -= 1
+        return 0.0 if self._tokens >= 0 else -self._tokens / self.rate
+
+
+@dataclass(frozen=True, slots=True)
+class BusLimits:
+    """Rate and concurrency limits of a bus."""
+
+    rate: float = COMMAND_RATE
+    burst: float = COMMAND_BURST
+    concurrency: int = COMMAND_CONCURRENCY
+
+
+@dataclass(slots=True)
+class _Bus:
+    """Commands waiting for one bus, the latest command per cover."""
+
+    limits: BusLimits
+    bucket: TokenBucket
+    semaphore: asyncio.Semaphore
+    pending: dict[str, CoverCommand] = field(default_factory=dict)
+    task: asyncio.Task | None = None
+    sending: set[asyncio.Task] = field(default_factory=set)
+
+    @classmethod
+    def create(cls, limits: BusLimits) -> _Bus:
+        """Create an empty bus."""
+        return cls(
+            limits,
+            TokenBucket(limits.rate, limits.burst),
+            asyncio.Semaphore(limits.concurrency),
+        )
+
+    def configure(self, limits: BusLimits) -> None:
+        """Apply new limits, calls already running keep their slot."""
+        if limits == self.limits:
+            return
+        self.limits = limits
+        self.bucket.rate = limits.rate
+        self.bucket.burst = limits.burst
+        self.semaphore = asyncio.Semaphore(limits.concurrency)
+
+
+class CommandQueue:
+    """Send cover commands per bus, rate limited and by priority.
+
+    A bus is the integration of a cover or a group configured by the user.
+    A newer command for a cover replaces its queued command, and queued
+    covers with the same target are moved with a single service call. Calls
+    run concurrently, up to the concurrency limit of the bus, so a slow
+    cover does not hold back the others. When a call for several covers
+    fails, they are queued again and sent one by one, so one failing cover
+    does not affect the others.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:  # noqa: D107
+        self.hass = hass
+        self._buses: dict[str, _Bus] = {}
+        self._order = itertools.count()
+        self.stats = {
+            "submitted": 0,
+            "sent": 0,
+            "calls": 0,
+            "replaced": 0,
+            "errors": 0,
+            "retries": 0,
+            "last_wait": None,
+            "max_wait": 0.0,
+        }
+
+    @property
+    def depth(self) -> dict[str, int]:
+        """Number of queued commands per bus."""
+        return {name: len(bus.pending) for name, bus in self._buses.items()}
+
+    def async_submit(
+        self,
+        bus_name: str,
+        entity_id: str,
+        service: str,
+        attribute: str,
+        position: int,
+        priority: CommandPriority = CommandPriority.ROUTINE,
+        limits: BusLimits | None = None,
+    ) -> asyncio.Future[bool]:
+        """Queue a command, resolving True once sent or False if replaced.
+
+        `limits` apply to the whole bus, entries sharing a bus should use
+        the same limits.
+        """
+        limits = limits or BusLimits()
+        bus = self._buses.get(bus_name)
+        if bus is None:
+            bus = self._buses[bus_name] = _Bus.create(limits)
+        else:
+            bus.configure(limits)
+        previous = bus.pending.get(entity_id)
+        if previous is not None:
+            self.stats["replaced"] += 1
+            # keep the place in line of a user command
+            priority = min(priority, previous.priority)
+            previous.future.set_result(False)
+        command = CoverCommand(
+            priority,
+            next(self._order),
+            entity_id,
+            service,
+            attribute,
+            position,
+            time.monotonic(),
+            self.hass.loop.create_future(),
+        )
+        bus.pending[entity_id] = command
+        self.stats["submitted"] += 1
+        self._async_start_drain(bus_name, bus)
+        return command.future
+
+    def _async_start_drain(self, bus_name: str, bus: _Bus) -> None:
+        """Make sure the queued commands of a bus are being sent."""
+        if bus.task is None or bus.task.done():
+            bus.task = self.hass.async_create_background_task(
+                self._async_drain(bus_name, bus), f"{DOMAIN} commands {bus_name}"
+            )
+
+    def async_cancel(self, entity_ids) -> None:
+        """Drop the queued commands of covers."""
+        for bus in self._buses.values():
+            for entity_id in entity_ids:
+                command = bus.pending.pop(entity_id, None)
+                if command is not None:
+                    command.future.set_result(False)
+
+    async def _async_drain(self, bus_name: str, bus: _Bus) -> None:
+        """Send the queued commands of a bus until it is empty."""
+        while bus.pending:
+            delay = bus.bucket.reserve()
+            head = min(bus.pending.values(), key=lambda c: (c.priority, c.order))
+            if head.priority is CommandPriority.ROUTINE:
+                delay += random.uniform(0, COMMAND_JITTER)
+            if delay:
+                await asyncio.sleep(delay)
+            semaphore = bus.semaphore
+            await semaphore.acquire()
+            if not bus.pending:
+                semaphore.release()
+                break
+            # commands may have been replaced while waiting
+            head = min(bus.pending.values(), key=lambda c: (c.priority, c.order))
+            batch = (
+                [head]
+                if head.single
+                else [
+                    command
+                    for command in bus.pending.values()
+                    if not command.single
+                    and command.service == head.service
+                    and command.position == head.position
+                ]
+            )
+            for command in batch:
+                del bus.pending[command.entity_id]
+            task = self.hass.async_create_background_task(
+                self._async_send(bus_name, bus, batch, semaphore),
+                f"{DOMAIN} send {bus_name}",
+            )
+            bus.sending.add(task)
+            task.add_done_callback(bus.sending.discard)
+
+    async def _async_send(
+        self,
+        bus_name: str,
+        bus: _Bus,
+        batch: list[CoverCommand],
+        semaphore: asyncio.Semaphore,
+    ) -> None:
+        """Call the cover service for commands sharing the same target."""
+        try:
+            await self._async_call(bus_name, bus, batch)
+        finally:
+            semaphore.release()
+
+    async def _async_call(
+        self, bus_name: str, bus: _Bus, batch: list[CoverCommand]
+    ) -> None:
+        """Call the cover service once, queueing failed covers for a retry."""
+        now = time.monotonic()
+        wait = max(now - command.submitted for command in batch)
+        self.stats["last_wait"] = round(wait, 3)
+        self.stats["max_wait"] = max(self.stats["max_wait"], round(wait, 3))
+        entity_ids = [command.entity_id for command in batch]
+        head = batch[0]
+        _LOGGER.debug(
+            "Sending %s %s to %s on %s after %.3f s",
+            head.service,
+            head.position,
+            entity_ids,
+            bus_name,
+            wait,
+        )
+        self.stats["calls"] += 1
+        try:
+            await self.hass.services.async_call(
+                COVER_DOMAIN,
+                head.service,
+                {
+                    ATTR_ENTITY_ID: entity_ids
+                    if len(entity_ids) > 1
+                    else entity_ids[0],
+                    head.attribute: head.position,
+                },
+            )
+        except Exception as err:  # noqa: BLE001
+            self.stats["errors"] += 1
+            if len(batch) == 1:
+                if not head.future.done():
+                    head.future.set_exception(err)
+                return
+            _LOGGER.debug("Retrying %s one by one after: %s", entity_ids, err)
+            for command in batch:
+                if command.future.done():
+                    continue
+                if command.entity_id in bus.pending:
+                    # a newer command was queued while this one was sent
+                    self.stats["replaced"] += 1
+                    command.future.set_result(False)
+                    continue
+                # keeps its place in line, each retry takes its own token
+                self.stats["retries"] += 1
+                command.single = True
+                bus.pending[command.entity_id] = command
+            self._async_start_drain(bus_name, bus)
+            return
+        self.stats["sent"] += len(batch)
+        for command in batch:
+            if not command.future.done():
+                command.future.set_result(True)
+
+
+def get_command_queue(hass: HomeAssistant) -> CommandQueue:
+    """Get the command queue shared by all config entries."""
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    if DATA_COMMAND_QUEUE not in domain_data:
+        domain_data[DATA_COMMAND_QUEUE] = CommandQueue(hass)
+    return domain_data[DATA_COMMAND_QUEUE]
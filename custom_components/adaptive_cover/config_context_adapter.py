@@ -1,6 +1,7 @@
 """This module provides a logging adapter that adds a configuration name to log messages."""
 
 import logging
+import time
 
 
 class ConfigContextAdapter(logging.LoggerAdapter):
@@ -16,6 +17,12 @@ class ConfigContextAdapter(logging.LoggerAdapter):
         """
         super().__init__(logger, extra or {})
         self.config_name = None
+        self._prefix = "[Unknown] "
+        self.rate_limit = 0
+        self._owns_logger = False
+        self._window_start = 0.0
+        self._window_count = 0
+        self._suppressed = 0
 
     def set_config_name(self, config_name):
         """Set the configuration name.
@@ -25,6 +32,60 @@ class ConfigContextAdapter(logging.LoggerAdapter):
 
         """
         self.config_name = config_name
+        self._prefix = f"[{config_name}] " if config_name else "[Unknown] "
+
+    def set_debug(self, enabled: bool, rate_limit: int = 0):
+        """Enable debug output for this configuration only.
+
+        Args:
+            enabled (bool): Log debug messages even if the integration logger
+                is not set to debug. Only works if the adapter wraps a logger
+                of its own, see `for_entry`.
+            rate_limit (int): Maximum number of debug messages per minute,
+                0 for no limit.
+
+        """
+        if self._owns_logger:
+            self.logger.setLevel(logging.DEBUG if enabled else logging.NOTSET)
+        self.rate_limit = rate_limit or 0
+
+    @classmethod
+    def for_entry(cls, logger: logging.Logger, entry_id: str):
+        """Create an adapter with a child logger for a config entry.
+
+        Pass the integration's package logger, so the child is named
+        `custom_components.adaptive_cover.<entry_id>`. The child propagates
+        to it, so the integration's log level still applies unless debug is
+        enabled for the entry.
+        """
+        adapter = cls(logger.getChild(entry_id))
+        adapter._owns_logger = True
+        return adapter
+
+    def debug(self, msg, *args, **kwargs):
+        """Log a debug message, dropping it if the rate limit is exceeded."""
+        if not self.isEnabledFor(logging.DEBUG):
+            return
+        # attribute the record to the caller, not to this method
+        kwargs["stacklevel"] = kwargs.get("stacklevel", 1) + 1
+        if self.rate_limit:
+            now = time.monotonic()
+            if now - self._window_start >= 60:
+                if self._suppressed:
+                    self.log(
+                        logging.DEBUG,
+                        "Suppressed %s debug messages in the last minute",
+                        self._suppressed,
+                        stacklevel=kwargs["stacklevel"],
+                    )
+                self._window_start = now
+                self._window_count = 0
+                self._suppressed = 0
+            if self._window_count >= self.rate_limit:
+                self._suppressed += 1
+                return
+            self._window_count += 1
+        self.log(logging.DEBUG, msg, *args, **kwargs)
 
     def process(self, msg, kwargs):
         """Process the log message and add the configuration name if set.
@@ -37,7 +98,4 @@ class ConfigContextAdapter(logging.LoggerAdapter):
             tuple: The processed log message and keyword arguments.
 
         """
-        if self.config_name:
-            return f"[{self.config_name}] {msg}", kwargs
-        else:
-            return f"[Unknown] {msg}", kwargs
+        return self._prefix + msg, kwargs
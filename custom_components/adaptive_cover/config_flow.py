@@ -21,6 +21,11 @@ from .const import (
     CONF_BLIND_SPOT_LEFT,
     CONF_BLIND_SPOT_RIGHT,
     CONF_CLIMATE_MODE,
+    CONF_COMMAND_BURST,
+    CONF_COMMAND_GROUP,
+    CONF_COMMAND_RATE,
+    CONF_DEBUG_MODE,
+    CONF_DEBUG_RATE_LIMIT,
     CONF_DEFAULT_HEIGHT,
     CONF_DELTA_POSITION,
     CONF_DELTA_TIME,
@@ -47,6 +52,7 @@ from .const import (
     CONF_MANUAL_OVERRIDE_DURATION,
     CONF_MANUAL_OVERRIDE_RESET,
     CONF_MANUAL_THRESHOLD,
+    CONF_MAX_CONCURRENT,
     CONF_MAX_ELEVATION,
     CONF_MAX_POSITION,
     CONF_MIN_ELEVATION,
@@ -57,6 +63,7 @@ from .const import (
     CONF_SENSOR_TYPE,
     CONF_START_ENTITY,
     CONF_START_TIME,
+    CONF_SUN_EPSILON,
     CONF_SUNRISE_OFFSET,
     CONF_SUNSET_OFFSET,
     CONF_SUNSET_POS,
@@ -70,6 +77,9 @@ from .const import (
     CONF_WEATHER_ENTITY,
     CONF_WEATHER_STATE,
     CONF_OUTSIDE_THRESHOLD,
+    COMMAND_BURST,
+    COMMAND_CONCURRENCY,
+    COMMAND_RATE,
     DOMAIN,
     SensorType,
     CONF_MIN_POSITION,
@@ -363,6 +373,38 @@ INTERPOLATION_OPTIONS = vol.Schema(
     }
 )
 
+ADVANCED_OPTIONS = vol.Schema(
+    {
+        vol.Optional(CONF_DEBUG_MODE, default=False): bool,
+        vol.Optional(CONF_DEBUG_RATE_LIMIT, default=0): selector.NumberSelector(
+            selector.NumberSelectorConfig(
+                min=0, mode="box", unit_of_measurement="messages/min"
+            )
+        ),
+        vol.Optional(CONF_COMMAND_GROUP): selector.TextSelector(),
+        vol.Optional(CONF_COMMAND_RATE, default=COMMAND_RATE): selector.NumberSelector(
+            selector.NumberSelectorConfig(
+                min=0.1, max=20, step=0.1, mode="box", unit_of_measurement="calls/s"
+            )
+        ),
+        vol.Optional(
+            CONF_COMMAND_BURST, default=COMMAND_BURST
+        ): selector.NumberSelector(
+            selector.NumberSelectorConfig(min=1, max=32, step=1, mode="box")
+        ),
+        vol.Optional(
+            CONF_MAX_CONCURRENT, default=COMMAND_CONCURRENCY
+        ): selector.NumberSelector(
+            selector.NumberSelectorConfig(min=1, max=32, step=1, mode="box")
+        ),
+        vol.Optional(CONF_SUN_EPSILON, default=0): selector.NumberSelector(
+            selector.NumberSelectorConfig(
+                min=0, max=5, step=0.05, mode="box", unit_of_measurement="°"
+            )
+        ),
+    }
+)
+
 
 def _get_azimuth_edges(data) -> tuple[int, int]:
     """Calculate azimuth edges."""
@@ -658,6 +700,7 @@ class OptionsFlowHandler(OptionsFlow):
             options.append("blind_spot")
         if self.options.get(CONF_INTERP):
             options.append("interp")
+        options.append("advanced")
         return self.async_show_menu(step_id="init", menu_options=options)
 
     async def async_step_automation(self, user_input: dict[str, Any] | None = None):
@@ -886,6 +929,18 @@ class OptionsFlowHandler(OptionsFlow):
             ),
         )
 
+    async def async_step_advanced(self, user_input: dict[str, Any] | None = None):
+        """Manage advanced options."""
+        if user_input is not None:
+            self.options.update(user_input)
+            return await self._update_options()
+        return self.async_show_form(
+            step_id="advanced",
+            data_schema=self.add_suggested_values_to_schema(
+                ADVANCED_OPTIONS, user_input or self.options
+            ),
+        )
+
     async def _update_options(self) -> FlowResult:
         """Update config entry options."""
         return self.async_create_entry(title="", data=self.options)
@@ -6,6 +6,34 @@ DOMAIN = "adaptive_cover"
 LOGGER = logging.getLogger(__package__)
 _LOGGER = logging.getLogger(__name__)
 
+DATA_EPHEMERIS = "ephemeris"
+DATA_EPHEMERIS_LOCK = "ephemeris_lock"
+DATA_SUN_DISPATCHER = "sun_dispatcher"
+DATA_COMMAND_QUEUE = "command_queue"
+DATA_STARTING = "starting"
+STORAGE_VERSION = 1
+STORAGE_SAVE_DELAY = 10  # seconds
+EPHEMERIS_CACHE_DAYS = 3
+EPHEMERIS_TABLE_RESOLUTION = 2  # minutes
+TIMELINE_RESOLUTION = 60  # seconds
+DECISION_TRACE_SIZE = 200
+REFRESH_COALESCE_WINDOW = 0.5  # seconds
+SUN_FANOUT_BATCH = 10  # entries
+SUN_FANOUT_STAGGER = 0.2  # seconds between batches
+COMMAND_RATE = 2  # calls per second and bus
+COMMAND_BURST = 4  # calls
+COMMAND_JITTER = 0.3  # seconds
+COMMAND_CONCURRENCY = 4  # calls running at once per bus
+STARTUP_BATCH = 5  # entries
+STARTUP_STAGGER = 1.0  # seconds between batches
+TARGET_TOLERANCE = 1  # percent
+TARGET_TIMEOUT = 120  # seconds
+TRAVEL_MIN_DISTANCE = 10  # percent, shorter moves are dominated by latency
+TRAVEL_SMOOTHING = 0.3  # weight of a new observation
+TRAVEL_TIMEOUT_FACTOR = 1.5
+TRAVEL_TIMEOUT_MARGIN = 10  # seconds
+TRAVEL_LEAD_MAX = 300  # seconds
+
 ATTR_POSITION = "position"
 ATTR_TILT_POSITION = "tilt_position"
 
@@ -73,6 +101,13 @@ CONF_MANUAL_OVERRIDE_DURATION = "manual_override_duration"
 CONF_MANUAL_OVERRIDE_RESET = "manual_override_reset"
 CONF_MANUAL_THRESHOLD = "manual_threshold"
 CONF_MANUAL_IGNORE_INTERMEDIATE = "manual_ignore_intermediate"
+CONF_DEBUG_MODE = "debug_mode"
+CONF_DEBUG_RATE_LIMIT = "debug_rate_limit"
+CONF_SUN_EPSILON = "sun_epsilon"
+CONF_COMMAND_GROUP = "command_group"
+CONF_COMMAND_RATE = "command_rate"
+CONF_COMMAND_BURST = "command_burst"
+CONF_MAX_CONCURRENT = "max_concurrent_calls"
 
 STRATEGY_MODE_BASIC = "basic"
 STRATEGY_MODE_CLIMATE = "climate"
@@ -4,14 +4,14 @@ from __future__ import annotations
 
 import asyncio
 import datetime as dt
+import heapq
+import time
+from typing import Any
 from dataclasses import dataclass
 
-import numpy as np
-import pytz
 from homeassistant.components.cover import DOMAIN as COVER_DOMAIN
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import (
-    ATTR_ENTITY_ID,
     SERVICE_SET_COVER_POSITION,
     SERVICE_SET_COVER_TILT_POSITION,
 )
@@ -22,21 +22,28 @@ from homeassistant.core import (
     State,
     callback,
 )
-from homeassistant.helpers.event import async_track_point_in_time
+from homeassistant.helpers.event import (
+    async_call_later,
+    async_track_point_in_time,
+)
+from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers.start import async_at_started
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
 
+from .command_queue import BusLimits, CommandPriority, get_command_queue
 from .config_context_adapter import ConfigContextAdapter
 
 from .calculation import (
+    AdaptiveGeneralCover,
     AdaptiveHorizontalCover,
     AdaptiveTiltCover,
     AdaptiveVerticalCover,
     ClimateCoverData,
     ClimateCoverState,
     NormalCoverState,
+    PositionTimeline,
 )
 from .const import (
-    _LOGGER,
     ATTR_POSITION,
     ATTR_TILT_POSITION,
     CONF_AWNING_ANGLE,
@@ -45,6 +52,11 @@ from .const import (
     CONF_BLIND_SPOT_LEFT,
     CONF_BLIND_SPOT_RIGHT,
     CONF_CLIMATE_MODE,
+    CONF_COMMAND_BURST,
+    CONF_COMMAND_GROUP,
+    CONF_COMMAND_RATE,
+    CONF_DEBUG_MODE,
+    CONF_DEBUG_RATE_LIMIT,
     CONF_DEFAULT_HEIGHT,
     CONF_DELTA_POSITION,
     CONF_DELTA_TIME,
@@ -73,6 +85,7 @@ from .const import (
     CONF_MANUAL_OVERRIDE_DURATION,
     CONF_MANUAL_OVERRIDE_RESET,
     CONF_MANUAL_THRESHOLD,
+    CONF_MAX_CONCURRENT,
     CONF_MAX_ELEVATION,
     CONF_MAX_POSITION,
     CONF_MIN_ELEVATION,
@@ -83,6 +96,7 @@ from .const import (
     CONF_RETURN_SUNSET,
     CONF_START_ENTITY,
     CONF_START_TIME,
+    CONF_SUN_EPSILON,
     CONF_SUNRISE_OFFSET,
     CONF_SUNSET_OFFSET,
     CONF_SUNSET_POS,
@@ -95,10 +109,37 @@ from .const import (
     CONF_TRANSPARENT_BLIND,
     CONF_WEATHER_ENTITY,
     CONF_WEATHER_STATE,
+    COMMAND_BURST,
+    COMMAND_CONCURRENCY,
+    COMMAND_RATE,
+    DATA_COMMAND_QUEUE,
+    DATA_STARTING,
+    DECISION_TRACE_SIZE,
     DOMAIN,
     LOGGER,
+    REFRESH_COALESCE_WINDOW,
+    STARTUP_BATCH,
+    STARTUP_STAGGER,
+    TARGET_TIMEOUT,
+    TARGET_TOLERANCE,
+    TRAVEL_LEAD_MAX,
+    TRAVEL_TIMEOUT_FACTOR,
+    TRAVEL_TIMEOUT_MARGIN,
+)
+from .helpers import (
+    interpolate,
+)
+from .snapshot import EntitySnapshot
+from .time_window import TimeWindow
+from .trace import DecisionRecord, DecisionTrace
+from .tracking import TargetResult, TargetTracker
+from .travel import TravelModel
+from .persistence import RuntimeStore, datetime_from_str, datetime_to_str
+from .sun import (
+    async_get_ephemeris_table,
+    async_warmup_sun_data,
+    get_ephemeris_cache,
 )
-from .helpers import get_datetime_from_str, get_last_updated, get_safe_state
 
 
 @dataclass
@@ -127,8 +168,12 @@ class AdaptiveDataUpdateCoordinator(DataUpdateCoordinator[AdaptiveCoverData]):
     def __init__(self, hass: HomeAssistant) -> None:  # noqa: D107
         super().__init__(hass, LOGGER, name=DOMAIN)
 
-        self.logger = ConfigContextAdapter(_LOGGER)
+        self.logger = ConfigContextAdapter.for_entry(LOGGER, self.config_entry.entry_id)
         self.logger.set_config_name(self.config_entry.data.get("name"))
+        self.logger.set_debug(
+            self.config_entry.options.get(CONF_DEBUG_MODE, False),
+            int(self.config_entry.options.get(CONF_DEBUG_RATE_LIMIT, 0)),
+        )
         self._cover_type = self.config_entry.data.get("sensor_type")
         self._climate_mode = self.config_entry.options.get(CONF_CLIMATE_MODE, False)
         self._switch_mode = True if self._climate_mode else False
@@ -140,10 +185,18 @@ class AdaptiveDataUpdateCoordinator(DataUpdateCoordinator[AdaptiveCoverData]):
         self._manual_toggle = None
         self._lux_toggle = None
         self._irradiance_toggle = None
-        self._start_time = None
         self._sun_end_time = None
         self._sun_start_time = None
-        # self._end_time = None
+        self._solar_times_date: dt.date | None = None
+        self._sun_edge_listeners: list = []
+        self.timeline: PositionTimeline | None = None
+        self._timeline_options = None
+        self.cover_model: AdaptiveGeneralCover | None = None
+        self.trace = DecisionTrace(DECISION_TRACE_SIZE)
+        self.climate_data: ClimateCoverData | None = None
+        self._compiled_options = None
+        self._snapshot_entities: list[str | None] = []
+        self.snapshot: EntitySnapshot | None = None
         self.manual_reset = self.config_entry.options.get(
             CONF_MANUAL_OVERRIDE_RESET, False
         )
@@ -151,55 +204,314 @@ class AdaptiveDataUpdateCoordinator(DataUpdateCoordinator[AdaptiveCoverData]):
             CONF_MANUAL_OVERRIDE_DURATION, {"minutes": 15}
         )
         self.state_change = False
-        self.cover_state_change = False
         self.first_refresh = False
         self.timed_refresh = False
         self.climate_state = None
         self.control_method = "intermediate"
         self.state_change_data: StateChangedData | None = None
+        # events are queued and merged into a single refresh at a time
+        self.refresh_reasons: list[str] = []
+        self._refresh_reasons: set[str] = set()
+        self._refresh_lock = asyncio.Lock()
+        self._refresh_task: asyncio.Task | None = None
+        self._coalesce_listener = None
+        # outcome of the last refresh, to skip refreshes that cannot change it
+        self.refresh_stats = {"executed": 0, "skipped": 0}
+        self._last_decision: tuple[int, bool, bool] | None = None
+        self._last_sun_inputs: tuple[float | None, float | None] = (None, None)
         self.manager = AdaptiveCoverManager(self.manual_duration, self.logger)
         self.wait_for_target = {}
         self.target_call = {}
+        self.targets: dict[str, TargetTracker] = {}
+        self.travel: dict[str, TravelModel] = {}
+        # covers start moving ahead of a predicted change, see _lookup_time
+        self._lead_to: tuple[dt.datetime, dt.timedelta] | None = None
+        self._aim: dt.datetime | None = None
         self.ignore_intermediate_states = self.config_entry.options.get(
             CONF_MANUAL_IGNORE_INTERMEDIATE, False
         )
-        self._update_listener = None
-        self._scheduled_time = dt.datetime.now()
+        self.dispatch_stats = {
+            "dispatches": 0,
+            "errors": 0,
+            "last_duration": None,
+            "last_slowest": None,
+            "cover_durations": {},
+        }
+        self._window_listeners: list = []
+        # single refresh at the next moment the outcome can change
+        self._wakeup_listener = None
+        self.next_wakeup: dt.datetime | None = None
+        self._retry_at: dt.datetime | None = None
+        self._manual_expiry_listener = None
+        self._manual_expiry: dt.datetime | None = None
+        self._time_window = TimeWindow()
+        self._time_window_key: tuple | None = None
 
         self._cached_options = None
+        self._store = RuntimeStore(hass, self.config_entry.entry_id)
+        self._sun_edges: list[dt.datetime] = []
+        self.restored = False
+        self._starting = True
+        # options are compiled by the first refresh, which runs after setup
+        self._update_options(self.config_entry.options)
+        self._snapshot_entities = [
+            "sun.sun",
+            self.start_time_entity,
+            self.end_time_entity,
+            *self.entities,
+        ]
+        self._live_states = EntitySnapshot.live(hass)
+        self.startup_stats: dict[str, float | None] = {
+            "setup": None,
+            "delay": None,
+            "first_refresh": None,
+        }
+
+    async def async_restore(self) -> None:
+        """Resume from the state saved before the last restart."""
+        data = await self._store.async_load()
+        if not data:
+            return
+        self.manager.restore(data.get("manual", {}))
+        self.travel = {
+            entity: TravelModel.from_dict(model)
+            for entity, model in data.get("travel", {}).items()
+        }
+        # commands sent before the restart either finished or were lost,
+        # waiting for them again would hide manual changes until a timeout
+        self.target_call.update(data.get("targets", {}))
+        solar = data.get("solar")
+        if solar and solar["date"] == dt.date.today().isoformat():
+            self._sun_start_time = datetime_from_str(solar["start"])
+            self._sun_end_time = datetime_from_str(solar["end"])
+            self._solar_times_date = dt.date.today()
+            self._sun_edges = [datetime_from_str(edge) for edge in solar["edges"]]
+            self._schedule_sun_edges(self._sun_edges)
+        if (last := data.get("data")) is not None:
+            states = dict(last["states"])
+            states["start"] = datetime_from_str(states["start"])
+            states["end"] = datetime_from_str(states["end"])
+            self.data = AdaptiveCoverData(
+                climate_mode_toggle=last["climate_mode_toggle"],
+                states=states,
+                attributes=last["attributes"],
+            )
+            self.restored = True
+        self.logger.debug("Restored runtime state, manual: %s", data.get("manual"))
+
+    @callback
+    def _async_schedule_save(self) -> None:
+        """Save the runtime state soon."""
+        self._store.async_schedule_save(self._runtime_state)
+
+    def _runtime_state(self) -> dict[str, Any]:
+        """Runtime state to resume from after a restart."""
+        data = None
+        if self.data is not None:
+            data = {
+                "climate_mode_toggle": self.data.climate_mode_toggle,
+                "states": {
+                    **self.data.states,
+                    "start": datetime_to_str(self.data.states["start"]),
+                    "end": datetime_to_str(self.data.states["end"]),
+                },
+                "attributes": self.data.attributes,
+            }
+        solar = None
+        if self._solar_times_date is not None:
+            solar = {
+                "date": self._solar_times_date.isoformat(),
+                "start": datetime_to_str(self._sun_start_time),
+                "end": datetime_to_str(self._sun_end_time),
+                "edges": [datetime_to_str(edge) for edge in self._sun_edges],
+            }
+        return {
+            "manual": self.manager.as_dict(),
+            "targets": {
+                entity: tracker.target for entity, tracker in self.targets.items()
+            },
+            "travel": {
+                entity: model.as_dict() for entity, model in self.travel.items()
+            },
+            "solar": solar,
+            "data": data,
+        }
+
+    @callback
+    def async_schedule_startup(self, setup_started: float) -> None:
+        """Run the first refresh in the background once Home Assistant started.
+
+        Entries starting together are spread out in batches, so they do not
+        compete for the executor and their covers do not all move at once.
+        """
+        starting = self.hass.data[DOMAIN].setdefault(DATA_STARTING, set())
+        delay = (len(starting) // STARTUP_BATCH) * STARTUP_STAGGER
+        starting.add(self.config_entry.entry_id)
+        self.startup_stats["setup"] = round(time.monotonic() - setup_started, 6)
+        self.startup_stats["delay"] = delay
+        self.config_entry.async_create_background_task(
+            self.hass,
+            self._async_startup(setup_started, delay),
+            f"{DOMAIN} startup {self.config_entry.entry_id}",
+        )
 
-    async def async_config_entry_first_refresh(self) -> None:
-        """Config entry first refresh."""
-        self.first_refresh = True
-        await super().async_config_entry_first_refresh()
-        self.logger.debug("Config entry first refresh")
+    async def _async_startup(self, setup_started: float, delay: float) -> None:
+        """Compute the first state, refreshes queued meanwhile wait for it."""
+        started = asyncio.Event()
+
+        @callback
+        def hass_started(_hass: HomeAssistant) -> None:
+            started.set()
+
+        try:
+            async with self._refresh_lock:
+                unsub = async_at_started(self.hass, hass_started)
+                try:
+                    await started.wait()
+                finally:
+                    unsub()
+                await asyncio.sleep(delay)
+                await async_get_ephemeris_table(self.hass)
+                await async_warmup_sun_data(self.hass)
+                if self.restored:
+                    # covers were controlled before the restart, only follow
+                    # changes since then like any other refresh
+                    self.state_change = True
+                else:
+                    self.first_refresh = True
+                await super().async_refresh()
+        except Exception:
+            self.logger.exception("Startup of %s failed", self.config_entry.title)
+        finally:
+            # later refreshes must not stay blocked behind a failed startup
+            self._starting = False
+            self.hass.data[DOMAIN].get(DATA_STARTING, set()).discard(
+                self.config_entry.entry_id
+            )
+            self.startup_stats["first_refresh"] = round(
+                time.monotonic() - setup_started, 6
+            )
+            self.logger.debug("First refresh after %s", self.startup_stats)
 
-    async def async_timed_refresh(self, event) -> None:
+    async def async_timed_refresh(self, now) -> None:
         """Control state at end time."""
+        self.logger.debug("End time reached at %s", now)
+        self._async_update_time_window()
+        self.async_queue_refresh("end_time")
 
-        now = dt.datetime.now()
-        if self.end_time is not None:
-            time = self.end_time
-        if self.end_time_entity is not None:
-            time = get_safe_state(self.hass, self.end_time_entity)
-
-        self.logger.debug("Checking timed refresh. End time: %s, now: %s", time, now)
-
-        time_check = now - get_datetime_from_str(time)
-        if time is not None and (time_check <= dt.timedelta(seconds=1)):
-            self.timed_refresh = True
-            self.logger.debug("Timed refresh triggered")
-            await self.async_refresh()
-        else:
-            self.logger.debug("Timed refresh, but: not equal to end time")
+    async def async_wakeup_refresh(self, now) -> None:
+        """Refresh at the predicted moment the outcome changes."""
+        self._wakeup_listener = None
+        self.logger.debug("Predicted change reached at %s", now)
+        self.async_queue_refresh("wakeup")
+
+    @callback
+    def _schedule_wakeup(self, now: dt.datetime, timeline: PositionTimeline) -> None:
+        """Schedule one refresh for the next moment the outcome can change.
+
+        Until then sun.sun updates are ignored, so the entry stays dormant
+        at night and while the sun is not in front of the window.
+        """
+        self._async_cancel_wakeup()
+        self._lead_to = None
+        retry_at, self._retry_at = self._retry_at, None
+        if self._climate_mode or self._use_interpolation:
+            return
+        options = self.config_entry.options
+        wakeup = timeline.next_change(
+            now,
+            self.default_state,
+            self.min_change,
+            (options.get(CONF_SUNSET_POS), options.get(CONF_DEFAULT_HEIGHT), 0, 100),
+        )
+        if wakeup is None:
+            return
+        target = timeline.state_at(wakeup)
+        lead = self._travel_lead(target) if target is not None else None
+        if lead:
+            # start moving early so the covers arrive at the change
+            self._lead_to = (wakeup, lead)
+            wakeup -= lead
+        if retry_at is not None:
+            wakeup = min(wakeup, retry_at)
+        wakeup = max(wakeup, now + dt.timedelta(seconds=1))
+        self.next_wakeup = wakeup
+        self._wakeup_listener = async_track_point_in_time(
+            self.hass, self.async_wakeup_refresh, wakeup
+        )
+        self.logger.debug("Next refresh predicted at %s", wakeup)
+
+    def _travel_lead(self, target: int) -> dt.timedelta | None:
+        """Time the slowest cover needs to reach `target`, if it is known.
+
+        Covers still moving are measured from the target they were sent to,
+        their reported position predates the command.
+        """
+        lead = 0.0
+        for entity in self.entities:
+            model = self.travel.get(entity)
+            tracker = self.targets.get(entity)
+            position = (
+                tracker.target
+                if tracker is not None
+                else self._get_current_position(entity)
+            )
+            if (
+                model is None
+                or position is None
+                or self.manager.is_cover_manual(entity)
+            ):
+                continue
+            estimate = model.estimate(target - position)
+            if estimate is not None:
+                lead = max(lead, estimate)
+        if not lead:
+            return None
+        return dt.timedelta(seconds=min(lead, TRAVEL_LEAD_MAX))
+
+    def _lookup_time(self, now: dt.datetime) -> dt.datetime:
+        """Moment whose state the covers should be in.
+
+        Within the lead time before a predicted change this is the moment of
+        the change, so covers are in position when it happens.
+        """
+        if self._lead_to is not None:
+            change, lead = self._lead_to
+            if change - lead <= now < change:
+                self._aim = change
+        if self._aim is not None and now < self._aim:
+            return self._aim
+        self._aim = None
+        return now
+
+    @callback
+    def _async_cancel_wakeup(self) -> None:
+        """Cancel the predicted refresh."""
+        if self._wakeup_listener is not None:
+            self._wakeup_listener()
+            self._wakeup_listener = None
+        self.next_wakeup = None
+
+    async def async_start_time_refresh(self, now) -> None:
+        """Control state at start time."""
+        self.logger.debug("Start time reached at %s", now)
+        self._async_update_time_window()
+        self.async_queue_refresh("start_time")
 
     async def async_check_entity_state_change(
         self, event: Event[EventStateChangedData]
     ) -> None:
         """Fetch and process state change event."""
         self.logger.debug("Entity state change")
-        self.state_change = True
-        await self.async_refresh()
+        if event.data["entity_id"] in (self.start_time_entity, self.end_time_entity):
+            self._async_update_time_window()
+        self.async_queue_refresh(f"entity:{event.data['entity_id']}")
+
+    @callback
+    def async_sun_update(self, delay: float) -> None:
+        """Queue a refresh for a sun position update from the dispatcher."""
+        self.logger.debug("Sun position update")
+        self.async_queue_refresh("entity:sun.sun", delay)
 
     async def async_check_cover_state_change(
         self, event: Event[EventStateChangedData]
@@ -214,12 +526,198 @@ class AdaptiveDataUpdateCoordinator(DataUpdateCoordinator[AdaptiveCoverData]):
             data["entity_id"], data["old_state"], data["new_state"]
         )
         if self.state_change_data.old_state.state != "unknown":
-            self.cover_state_change = True
             self.process_entity_state_change()
-            await self.async_refresh()
+            self._async_check_manual_override(self.state_change_data)
         else:
             self.logger.debug("Old state is unknown, not processing")
 
+    @callback
+    def _async_check_manual_override(self, event: StateChangedData) -> None:
+        """Detect manual override against the last computed state.
+
+        Cover feedback only needs a full refresh when the manual override
+        state of the cover changes.
+        """
+        if self.data is None or not (self.manual_toggle and self.control_toggle):
+            return
+        entity_id = event.entity_id
+        was_manual = self.manager.is_cover_manual(entity_id)
+        self.manager.handle_state_change(
+            event,
+            self.data.states["state"],
+            self._cover_type,
+            self.manual_reset,
+            self.wait_for_target,
+            self.manual_threshold,
+        )
+        if self.manager.is_cover_manual(entity_id) != was_manual:
+            self.async_queue_refresh(f"cover:{entity_id}")
+            self._async_schedule_save()
+        self._schedule_manual_expiry()
+
+    @callback
+    def async_reset_manual(self, entity: str) -> None:
+        """Return a cover to automatic control."""
+        self.manager.reset(entity)
+        self._schedule_manual_expiry()
+
+    @callback
+    def _schedule_manual_expiry(self) -> None:
+        """Refresh when the earliest manual override expires."""
+        expiry = self.manager.next_expiry
+        if expiry == self._manual_expiry:
+            return
+        if self._manual_expiry_listener is not None:
+            self._manual_expiry_listener()
+            self._manual_expiry_listener = None
+        self._manual_expiry = expiry
+        if expiry is not None:
+            self._manual_expiry_listener = async_track_point_in_time(
+                self.hass, self.async_manual_expiry_refresh, expiry
+            )
+            self.logger.debug("Next manual override expiry at %s", expiry)
+
+    async def async_manual_expiry_refresh(self, now) -> None:
+        """Reset expired manual overrides and move the covers back."""
+        self._manual_expiry_listener = None
+        self._manual_expiry = None
+        self.logger.debug("Manual override expired at %s", now)
+        self.async_queue_refresh("manual_expiry")
+
+    @callback
+    def async_queue_refresh(
+        self, reason: str, delay: float = REFRESH_COALESCE_WINDOW
+    ) -> None:
+        """Queue a refresh, merging events that arrive within `delay`."""
+        self._refresh_reasons.add(reason)
+        if self._coalesce_listener is None and (
+            self._refresh_task is None or self._refresh_task.done()
+        ):
+            self._coalesce_listener = async_call_later(
+                self.hass, delay, self._async_start_queued_refresh
+            )
+
+    @callback
+    def _async_start_queued_refresh(self, _now) -> None:
+        """Start working off the queue once the coalescing window has passed."""
+        self._coalesce_listener = None
+        self._refresh_task = self.config_entry.async_create_background_task(
+            self.hass,
+            self._async_run_queued_refreshes(),
+            f"{DOMAIN} queued refresh {self.config_entry.entry_id}",
+        )
+
+    async def _async_run_queued_refreshes(self) -> None:
+        """Refresh until the queue is empty.
+
+        Events arriving while a refresh is running are merged into a single
+        follow-up refresh.
+        """
+        while self._refresh_reasons:
+            reasons = sorted(self._refresh_reasons)
+            self._refresh_reasons.clear()
+            if not self._is_significant(reasons):
+                self.refresh_stats["skipped"] += 1
+                continue
+            await self._async_refresh_for(reasons)
+
+    def _is_significant(self, reasons: list[str]) -> bool:
+        """Check if a refresh for these reasons could change the outcome.
+
+        Only refreshes triggered by sun.sun alone are filtered, anything
+        else always refreshes.
+        """
+        if reasons != ["entity:sun.sun"] or self._last_decision is None:
+            return True
+        sun = self.hass.states.get("sun.sun")
+        azimuth = sun.attributes.get("azimuth") if sun else None
+        elevation = sun.attributes.get("elevation") if sun else None
+        last_azimuth, last_elevation = self._last_sun_inputs
+        epsilon = self.config_entry.options.get(CONF_SUN_EPSILON, 0)
+        if (
+            epsilon
+            and None not in (azimuth, elevation, last_azimuth, last_elevation)
+            and abs(azimuth - last_azimuth) < epsilon
+            and abs(elevation - last_elevation) < epsilon
+        ):
+            self.logger.debug("Sun moved less than %s°, skipping refresh", epsilon)
+            return False
+        if self._wakeup_listener is not None:
+            self.logger.debug(
+                "Waiting for the predicted change at %s", self.next_wakeup
+            )
+            return False
+        return self._state_may_change()
+
+    def _state_may_change(self) -> bool:
+        """Check if the position changed enough since the last refresh to act on."""
+        timeline = self.timeline
+        if (
+            self._climate_mode
+            or self._use_interpolation
+            or timeline is None
+            or timeline.day != dt.date.today()
+            or self._compiled_options is not self.config_entry.options
+        ):
+            return True
+        now = dt.datetime.now(dt.UTC)
+        if self._aim is not None and now < self._aim:
+            now = self._aim
+        state = timeline.state_at(now)
+        if state is None:
+            return True
+        state = round(state)
+        last_state, last_valid, last_in_time = self._last_decision
+        if (
+            timeline.valid_at(now) != last_valid
+            or self.check_adaptive_time != last_in_time
+        ):
+            return True
+        options = self.config_entry.options
+        if state != last_state and state in (
+            options.get(CONF_SUNSET_POS),
+            options.get(CONF_DEFAULT_HEIGHT),
+            0,
+            100,
+        ):
+            return True
+        if abs(state - last_state) < self.min_change:
+            self.logger.debug(
+                "Position %s is within %s of %s, skipping refresh",
+                state,
+                self.min_change,
+                last_state,
+            )
+            return False
+        return True
+
+    async def async_refresh(self) -> None:
+        """Refresh data, waiting for a running refresh to finish first."""
+        if self._starting:
+            # switches restoring their state, the startup refresh follows
+            return
+        await self._async_refresh_for([])
+
+    async def _async_refresh_for(self, reasons: list[str]) -> None:
+        """Run a single refresh for the merged reasons."""
+        async with self._refresh_lock:
+            if reasons:
+                self.logger.debug("Refreshing for %s", reasons)
+            self.refresh_reasons = reasons
+            for reason in reasons:
+                kind = reason.partition(":")[0]
+                if kind in (
+                    "entity",
+                    "sun_edge",
+                    "start_time",
+                    "wakeup",
+                    "manual_expiry",
+                ):
+                    self.state_change = True
+                elif kind == "end_time" and self._track_end_time:
+                    self.timed_refresh = True
+            await super().async_refresh()
+
     def process_entity_state_change(self):
         """Process state change event."""
         event = self.state_change_data
@@ -231,13 +729,14 @@ class AdaptiveDataUpdateCoordinator(DataUpdateCoordinator[AdaptiveCoverData]):
         ]:
             self.logger.debug("Ignoring intermediate state change for %s", entity_id)
             return
-        if self.wait_for_target.get(entity_id):
+        tracker = self.targets.get(entity_id)
+        if self.wait_for_target.get(entity_id) and tracker is not None:
             position = event.new_state.attributes.get(
                 "current_position"
                 if self._cover_type != "cover_tilt"
                 else "current_tilt_position"
             )
-            if position == self.target_call.get(entity_id):
+            if tracker.update(position):
                 self.wait_for_target[entity_id] = False
                 self.logger.debug("Position %s reached for %s", position, entity_id)
             self.logger.debug("Wait for target: %s", self.wait_for_target)
@@ -245,92 +744,191 @@ class AdaptiveDataUpdateCoordinator(DataUpdateCoordinator[AdaptiveCoverData]):
             self.logger.debug("No wait for target call for %s", entity_id)
 
     @callback
-    def _async_cancel_update_listener(self) -> None:
-        """Cancel the scheduled update."""
-        if self._update_listener:
-            self._update_listener()
-            self._update_listener = None
+    def _schedule_window_edges(self, window: TimeWindow) -> None:
+        """Refresh exactly at the start and end time."""
+        self._async_cancel_window_listeners()
+        now = dt.datetime.now()
+        for edge, action in (
+            (window.start, self.async_start_time_refresh),
+            (window.end, self.async_timed_refresh),
+        ):
+            if edge is not None and edge > now:
+                # the times are naive local times, like `now`
+                self._window_listeners.append(
+                    async_track_point_in_time(self.hass, action, edge.astimezone())
+                )
+        # the times of tomorrow are parsed at midnight
+        midnight = dt.datetime.combine(now.date() + dt.timedelta(days=1), dt.time())
+        self._window_listeners.append(
+            async_track_point_in_time(
+                self.hass, self._async_time_window_midnight, midnight.astimezone()
+            )
+        )
+        self.logger.debug("Scheduled start and end time refreshes for %s", window)
 
-    async def async_timed_end_time(self) -> None:
-        """Control state at end time."""
-        self.logger.debug("Scheduling end time update at %s", self._end_time)
-        self._async_cancel_update_listener()
+    @callback
+    def _async_time_window_midnight(self, _now) -> None:
+        """Parse and schedule the start and end time of the new day."""
+        self._async_update_time_window()
+
+    @callback
+    def _async_cancel_window_listeners(self) -> None:
+        """Cancel the scheduled start and end time refreshes."""
+        for unsub in self._window_listeners:
+            unsub()
+        self._window_listeners = []
+
+    @staticmethod
+    def _compute_solar_times(cover):
+        """Compute sun start/end times and window edges (in the executor)."""
+        start, end = cover.solar_times()
+        return start, end, cover.sun_edges()
+
+    @callback
+    def _schedule_sun_edges(self, edges: list[dt.datetime]) -> None:
+        """Refresh exactly when the sun enters or leaves the window."""
+        self._async_cancel_sun_edge_listeners()
+        now = dt.datetime.now(dt.UTC)
+        for edge in edges:
+            if edge > now:
+                self._sun_edge_listeners.append(
+                    async_track_point_in_time(
+                        self.hass, self.async_sun_edge_refresh, edge
+                    )
+                )
         self.logger.debug(
-            "End time: %s, Track end time: %s, Scheduled time: %s, Condition: %s",
-            self._end_time,
-            self._track_end_time,
-            self._scheduled_time,
-            self._end_time > self._scheduled_time,
-        )
-        self._update_listener = async_track_point_in_time(
-            self.hass, self.async_timed_refresh, self._end_time
+            "Scheduled %s sun edge refreshes", len(self._sun_edge_listeners)
         )
-        self._scheduled_time = self._end_time
+
+    @callback
+    def _async_cancel_sun_edge_listeners(self) -> None:
+        """Cancel scheduled sun edge refreshes."""
+        for unsub in self._sun_edge_listeners:
+            unsub()
+        self._sun_edge_listeners = []
+
+    async def async_sun_edge_refresh(self, now) -> None:
+        """Refresh when the sun enters or leaves the window."""
+        self.logger.debug("Sun edge reached at %s", now)
+        self.async_queue_refresh("sun_edge")
+
+    async def async_shutdown(self) -> None:
+        """Cancel scheduled listeners."""
+        await super().async_shutdown()
+        if self._coalesce_listener is not None:
+            self._coalesce_listener()
+            self._coalesce_listener = None
+        self._refresh_reasons.clear()
+        for tracker in list(self.targets.values()):
+            tracker.resolve(TargetResult.CANCELLED)
+        self._async_cancel_sun_edge_listeners()
+        self._async_cancel_window_listeners()
+        self._async_cancel_wakeup()
+        if DATA_COMMAND_QUEUE in self.hass.data.get(DOMAIN, {}):
+            get_command_queue(self.hass).async_cancel(self.entities)
+        if self._manual_expiry_listener is not None:
+            self._manual_expiry_listener()
+            self._manual_expiry_listener = None
+        self.logger.set_debug(False)
 
     async def _async_update_data(self) -> AdaptiveCoverData:
         self.logger.debug("Updating data")
+        self.refresh_stats["executed"] += 1
+        # sun position is interpolated from the shared yearly table
+        await async_get_ephemeris_table(self.hass)
         if self.first_refresh:
             self._cached_options = self.config_entry.options
 
         options = self.config_entry.options
-        self._update_options(options)
-
-        # Get data for the blind
-        cover_data = self.get_blind_data(options=options)
+        if options is not self._compiled_options:
+            self._compile(options)
+
+        # all decisions of this refresh read the same entity states
+        self.snapshot = EntitySnapshot.capture(self.hass, self._snapshot_entities)
+        try:
+            return await self._async_update_from_snapshot(options)
+        finally:
+            self.snapshot = None
+
+    async def _async_update_from_snapshot(self, options) -> AdaptiveCoverData:
+        """Determine the state from the entity snapshot and control the covers."""
+        # Only the sun position changes between refreshes
+        cover_data = self.cover_model
+        cover_data.sol_azi, cover_data.sol_elev = self.pos_sun
 
         # Update manager with covers
         self._update_manager_and_covers()
 
         # Access climate data if climate mode is enabled
         if self._climate_mode:
-            self.climate_mode_data(options, cover_data)
+            self.climate_mode_data()
         else:
             self.logger.debug("Control method is %s", self.control_method)
 
         # calculate the state of the cover
-        self.normal_cover_state = NormalCoverState(cover_data)
         self.logger.debug(
             "Determined normal cover state to be %s", self.normal_cover_state
         )
 
-        self.default_state = round(self.normal_cover_state.get_state())
+        # the normal state only depends on the time, look it up
+        timeline = self._get_timeline(cover_data, options)
+        now = dt.datetime.now(dt.UTC)
+        at = self._lookup_time(now)
+        default_state = timeline.state_at(at)
+        sun_motion = timeline.valid_at(at)
+        # the grid lags up to a sample behind the exact moment refreshes at
+        # sun edges and predicted changes are scheduled for
+        live = default_state is None or (
+            at == now
+            and any(reason in ("sun_edge", "wakeup") for reason in self.refresh_reasons)
+        )
+        if live:
+            default_state = self.normal_cover_state.get_state()
+            sun_motion = cover_data.valid
+        self.default_state = round(default_state)
         self.logger.debug("Determined default state to be %s", self.default_state)
+        self._last_decision = (
+            self.default_state,
+            bool(sun_motion),
+            self.check_adaptive_time,
+        )
+        self._last_sun_inputs = (
+            self.snapshot.attribute("sun.sun", "azimuth"),
+            self.snapshot.attribute("sun.sun", "elevation"),
+        )
         state = self.state
+        self.trace.append(self._decision_record(now, at, timeline, state, live))
 
         await self.manager.reset_if_needed()
-
-        if (
-            self._end_time
-            and self._track_end_time
-            and self._end_time > self._scheduled_time
-        ):
-            await self.async_timed_end_time()
+        self._schedule_manual_expiry()
 
         # Handle types of changes
         if self.state_change:
             await self.async_handle_state_change(state, options)
-        if self.cover_state_change:
-            await self.async_handle_cover_state_change(state)
         if self.first_refresh:
             await self.async_handle_first_refresh(state, options)
         if self.timed_refresh:
             await self.async_handle_timed_refresh(options)
 
+        self._schedule_wakeup(at, timeline)
+
         normal_cover = self.normal_cover_state.cover
         # Run the solar_times method in a separate thread
-        if (
-            self.first_refresh
-            or self._sun_start_time is None
-            or dt.datetime.now(pytz.UTC).date() != self._sun_start_time.date()
-        ):
+        if self.first_refresh or self._solar_times_date != dt.date.today():
             self.logger.debug("Calculating solar times")
             loop = asyncio.get_event_loop()
-            start, end = await loop.run_in_executor(None, normal_cover.solar_times)
+            start, end, edges = await loop.run_in_executor(
+                None, self._compute_solar_times, normal_cover
+            )
             self._sun_start_time = start
             self._sun_end_time = end
+            self._solar_times_date = dt.date.today()
+            self._sun_edges = edges
             self.logger.debug("Sun start time: %s, Sun end time: %s", start, end)
+            self._schedule_sun_edges(edges)
         else:
             start, end = self._sun_start_time, self._sun_end_time
+        self._async_schedule_save()
         return AdaptiveCoverData(
             climate_mode_toggle=self.switch_mode,
             states={
@@ -338,7 +936,7 @@ class AdaptiveDataUpdateCoordinator(DataUpdateCoordinator[AdaptiveCoverData]):
                 "start": start,
                 "end": end,
                 "control": self.control_method,
-                "sun_motion": normal_cover.valid,
+                "sun_motion": sun_motion,
                 "manual_override": self.manager.binary_cover_manual,
                 "manual_list": self.manager.manual_controlled,
             },
@@ -355,40 +953,100 @@ class AdaptiveDataUpdateCoordinator(DataUpdateCoordinator[AdaptiveCoverData]):
             },
         )
 
+    def _decision_record(
+        self,
+        now: dt.datetime,
+        at: dt.datetime,
+        timeline: PositionTimeline,
+        state: int,
+        live: bool,
+    ) -> DecisionRecord:
+        """Describe how the state looked up at `at` was determined."""
+        index = None if live else timeline.index(at)
+        if index is not None:
+            normal_branch, normal_clamp = timeline.decision(index)
+        else:
+            normal_branch = self.normal_cover_state.branch
+            normal_clamp = self.normal_cover_state.clamp
+        triggers = [
+            name
+            for name, flag in (
+                ("state_change", self.state_change),
+                ("first_refresh", self.first_refresh),
+                ("timed_refresh", self.timed_refresh),
+            )
+            if flag
+        ]
+        record = DecisionRecord(
+            time=now,
+            aim=at if at != now else None,
+            trigger=",".join(triggers) or "update",
+            reasons=self.refresh_reasons or None,
+            sun_azimuth=self.cover_model.sol_azi,
+            sun_elevation=self.cover_model.sol_elev,
+            normal_branch=normal_branch,
+            normal_clamp=normal_clamp,
+            normal_state=self.default_state,
+            control_method=self.control_method,
+            final_state=state,
+            manual_override=self.manager.manual_controlled or None,
+        )
+        if self._climate_mode:
+            record.climate_inputs = self.climate_data.inputs
+            record.climate_branch = self.climate_cover_state.climate_branch
+            record.climate_clamp = self.climate_cover_state.clamp
+            record.climate_state = self.climate_state
+        return record
+
+    def _get_timeline(self, cover, options) -> PositionTimeline:
+        """Get today's position timeline, rebuilding it for a new day or options."""
+        if (
+            self.timeline is None
+            or self.timeline.day != dt.date.today()
+            or options is not self._timeline_options
+        ):
+            self.timeline = cover.timeline()
+            self._timeline_options = options
+            self.logger.debug("Computed position timeline for %s", self.timeline.day)
+        return self.timeline
+
     async def async_handle_state_change(self, state: int, options):
         """Handle state change from tracked entities."""
         if self.control_toggle:
-            for cover in self.entities:
-                await self.async_handle_call_service(cover, state, options)
+            if self.check_adaptive_time:
+                targets = {}
+                for cover in self.entities:
+                    if not self.check_position_delta(
+                        cover, state, options
+                    ) or self.manager.is_cover_manual(cover):
+                        continue
+                    if self.check_time_delta(cover):
+                        targets[cover] = state
+                        continue
+                    # moved too recently, try again once the interval passed
+                    retry = self.entity_states.last_updated(cover) + dt.timedelta(
+                        minutes=self.time_threshold
+                    )
+                    if self._retry_at is None or retry < self._retry_at:
+                        self._retry_at = retry
+                await self.async_set_positions(targets)
         else:
             self.logger.debug("State change but control toggle is off")
         self.state_change = False
         self.logger.debug("State change handled")
 
-    async def async_handle_cover_state_change(self, state: int):
-        """Handle state change from assigned covers."""
-        if self.manual_toggle and self.control_toggle:
-            self.manager.handle_state_change(
-                self.state_change_data,
-                state,
-                self._cover_type,
-                self.manual_reset,
-                self.wait_for_target,
-                self.manual_threshold,
-            )
-        self.cover_state_change = False
-        self.logger.debug("Cover state change handled")
-
     async def async_handle_first_refresh(self, state: int, options):
         """Handle first refresh."""
         if self.control_toggle:
-            for cover in self.entities:
-                if (
-                    self.check_adaptive_time
-                    and not self.manager.is_cover_manual(cover)
-                    and self.check_position_delta(cover, state, options)
-                ):
-                    await self.async_set_position(cover, state)
+            if self.check_adaptive_time:
+                await self.async_set_positions(
+                    {
+                        cover: state
+                        for cover in self.entities
+                        if not self.manager.is_cover_manual(cover)
+                        and self.check_position_delta(cover, state, options)
+                    }
+                )
         else:
             self.logger.debug("First refresh but control toggle is off")
         self.first_refresh = False
@@ -401,56 +1059,219 @@ class AdaptiveDataUpdateCoordinator(DataUpdateCoordinator[AdaptiveCoverData]):
             options.get(CONF_SUNSET_POS),
         )
         if self.control_toggle:
-            for cover in self.entities:
-                await self.async_set_manual_position(
-                    cover,
-                    (
-                        inverse_state(options.get(CONF_SUNSET_POS))
-                        if self._inverse_state
-                        else options.get(CONF_SUNSET_POS)
-                    ),
-                )
+            position = (
+                inverse_state(options.get(CONF_SUNSET_POS))
+                if self._inverse_state
+                else options.get(CONF_SUNSET_POS)
+            )
+            await self.async_set_positions(dict.fromkeys(self.entities, position))
         else:
             self.logger.debug("Timed refresh but control toggle is off")
         self.timed_refresh = False
         self.logger.debug("Timed refresh handled")
 
-    async def async_handle_call_service(self, entity, state: int, options):
-        """Handle call service."""
-        if (
-            self.check_adaptive_time
-            and self.check_position_delta(entity, state, options)
-            and self.check_time_delta(entity)
-            and not self.manager.is_cover_manual(entity)
-        ):
-            await self.async_set_position(entity, state)
-
-    async def async_set_position(self, entity, state: int):
-        """Call service to set cover position."""
-        await self.async_set_manual_position(entity, state)
-
-    async def async_set_manual_position(self, entity, state):
-        """Call service to set cover position."""
-        if self.check_position(entity, state):
-            service = SERVICE_SET_COVER_POSITION
-            service_data = {}
-            service_data[ATTR_ENTITY_ID] = entity
-
-            if self._cover_type == "cover_tilt":
-                service = SERVICE_SET_COVER_TILT_POSITION
-                service_data[ATTR_TILT_POSITION] = state
-            else:
-                service_data[ATTR_POSITION] = state
-
-            self.wait_for_target[entity] = True
-            self.target_call[entity] = state
-            self.logger.debug(
-                "Set wait for target %s and target call %s",
-                self.wait_for_target,
-                self.target_call,
+    async def async_set_position(self, entity, state: int) -> bool:
+        """Call service to set cover position, False if it is already there."""
+        return await self.async_set_manual_position(entity, state)
+
+    async def async_set_manual_position(self, entity, state) -> bool:
+        """Call service to set cover position on behalf of the user."""
+        return bool(
+            await self.async_set_positions({entity: state}, CommandPriority.USER)
+        )
+
+    async def async_set_positions(
+        self,
+        targets: dict[str, int],
+        priority: CommandPriority = CommandPriority.ROUTINE,
+    ) -> list[str]:
+        """Move covers to their targets, returning the covers sent a command.
+
+        Covers that need the same position share one service call. The calls
+        go through the shared command queue, which limits the rate per bus
+        and retries a failed call per cover.
+        """
+        groups: dict[int, list[str]] = {}
+        for entity, state in targets.items():
+            if self.check_position(entity, state):
+                groups.setdefault(state, []).append(entity)
+        if not groups:
+            return []
+        durations: dict[str, float] = {}
+        sent: list[str] = []
+
+        async def run(state: int, entities: list[str]):
+            started = time.monotonic()
+            try:
+                sent.extend(
+                    await self._async_call_cover_service(entities, state, priority)
+                )
+            finally:
+                duration = time.monotonic() - started
+                for entity in entities:
+                    durations[entity] = duration
+
+        started = time.monotonic()
+        await asyncio.gather(
+            *(run(state, entities) for state, entities in groups.items())
+        )
+        duration = time.monotonic() - started
+        stats = self.dispatch_stats
+        stats["dispatches"] += 1
+        stats["last_duration"] = round(duration, 4)
+        stats["last_slowest"] = round(max(durations.values(), default=0), 4)
+        stats["cover_durations"] = {
+            cover: round(value, 4) for cover, value in durations.items()
+        }
+        self.logger.debug(
+            "Moved %s covers in %.3f s (slowest %.3f s)",
+            len(durations),
+            duration,
+            stats["last_slowest"],
+        )
+        return sent
+
+    async def _async_call_cover_service(
+        self, entities: list[str], state: int, priority: CommandPriority
+    ) -> list[str]:
+        """Queue the position service for covers sharing the same target.
+
+        Returns the covers whose command was sent, the targets of covers
+        whose command failed resolve as FAILED.
+        """
+        service = SERVICE_SET_COVER_POSITION
+        attribute = ATTR_POSITION
+        if self._cover_type == "cover_tilt":
+            service = SERVICE_SET_COVER_TILT_POSITION
+            attribute = ATTR_TILT_POSITION
+
+        for entity in entities:
+            self._async_track_target(entity, state)
+        self.logger.debug(
+            "Set wait for target %s and target call %s",
+            self.wait_for_target,
+            self.target_call,
+        )
+        self.logger.debug("Queue %s %s for %s", service, state, entities)
+        queue = get_command_queue(self.hass)
+        results = await asyncio.gather(
+            *(
+                queue.async_submit(
+                    self._command_bus(entity),
+                    entity,
+                    service,
+                    attribute,
+                    state,
+                    priority,
+                    self._bus_limits,
+                )
+                for entity in entities
+            ),
+            return_exceptions=True,
+        )
+        sent = []
+        for entity, result in zip(entities, results, strict=True):
+            if result is True:
+                self._async_target_sent(entity, state)
+                sent.append(entity)
+            elif isinstance(result, Exception):
+                self.dispatch_stats["errors"] += 1
+                self.logger.error("Failed to control %s: %s", entity, result)
+                tracker = self.targets.get(entity)
+                if tracker is not None and tracker.target == state:
+                    tracker.resolve(TargetResult.FAILED)
+        return sent
+
+    def _command_bus(self, entity: str) -> str:
+        """Name of the bus the commands of a cover are limited on."""
+        group = self.config_entry.options.get(CONF_COMMAND_GROUP)
+        if group:
+            return f"group:{group}"
+        entry = er.async_get(self.hass).async_get(entity)
+        return entry.platform if entry is not None else COVER_DOMAIN
+
+    @callback
+    def _async_track_target(self, entity: str, state: int) -> None:
+        """Track a new target of a cover, replacing the previous one."""
+        previous = self.targets.get(entity)
+        if previous is not None:
+            previous.resolve(TargetResult.SUPERSEDED)
+        tracker = TargetTracker(
+            self.hass, entity, state, TARGET_TOLERANCE, TARGET_TIMEOUT
+        )
+        tracker.future.add_done_callback(
+            lambda future: self._async_target_done(tracker)
+        )
+        self.targets[entity] = tracker
+        self.wait_for_target[entity] = True
+        self.target_call[entity] = state
+        self._async_schedule_save()
+
+    @callback
+    def _async_target_sent(self, entity: str, state: int) -> None:
+        """Time the move of a cover once its command was sent."""
+        tracker = self.targets.get(entity)
+        if tracker is None or tracker.target != state:
+            return
+        position = self._get_current_position(entity)
+        model = self.travel.get(entity)
+        expected = (
+            model.estimate(state - position)
+            if model is not None and position is not None
+            else None
+        )
+        timeout = (
+            TARGET_TIMEOUT
+            if expected is None
+            else expected * TRAVEL_TIMEOUT_FACTOR + TRAVEL_TIMEOUT_MARGIN
+        )
+        tracker.sent(position, expected, timeout)
+
+    @callback
+    def _async_target_done(self, tracker: TargetTracker) -> None:
+        """Stop waiting for a cover once its current target is resolved."""
+        entity = tracker.entity_id
+        result = tracker.future.result()
+        self._async_learn_travel(tracker, result)
+        if self.targets.get(entity) is not tracker:
+            return
+        del self.targets[entity]
+        self.wait_for_target[entity] = False
+        self.logger.debug("Target %s of %s: %s", tracker.target, entity, result)
+        if result is not TargetResult.CANCELLED:
+            self._async_schedule_save()
+
+    @callback
+    def _async_learn_travel(self, tracker: TargetTracker, result: TargetResult) -> None:
+        """Update the travel model of a cover from a finished move."""
+        elapsed = tracker.elapsed
+        if elapsed is None or tracker.start_position is None:
+            return
+        if result is TargetResult.REACHED:
+            model = self.travel.setdefault(tracker.entity_id, TravelModel())
+            distance = abs(tracker.target - tracker.start_position)
+            if model.observe(distance, elapsed):
+                self.logger.debug(
+                    "Learned %.2f s per percent for %s",
+                    model.seconds_per_percent,
+                    tracker.entity_id,
+                )
+        elif result is TargetResult.TIMEOUT and tracker.expected is not None:
+            self.travel[tracker.entity_id].stuck += 1
+            self.logger.warning(
+                "%s did not reach %s within %.0f s, expected %.0f s",
+                tracker.entity_id,
+                tracker.target,
+                elapsed,
+                tracker.expected,
             )
-            self.logger.debug("Run %s with data %s", service, service_data)
-            await self.hass.services.async_call(COVER_DOMAIN, service, service_data)
+
+    async def async_wait_for_target(self, entity: str) -> TargetResult | None:
+        """Wait until a cover reached its target, None if it has none."""
+        tracker = self.targets.get(entity)
+        if tracker is None:
+            return None
+        return await tracker.wait()
 
     def _update_options(self, options):
         """Update options."""
@@ -470,6 +1291,31 @@ class AdaptiveDataUpdateCoordinator(DataUpdateCoordinator[AdaptiveCoverData]):
         self.end_value = options.get(CONF_INTERP_END)
         self.normal_list = options.get(CONF_INTERP_LIST)
         self.new_list = options.get(CONF_INTERP_LIST_NEW)
+        self._bus_limits = BusLimits(
+            float(options.get(CONF_COMMAND_RATE, COMMAND_RATE)),
+            float(options.get(CONF_COMMAND_BURST, COMMAND_BURST)),
+            int(options.get(CONF_MAX_CONCURRENT, COMMAND_CONCURRENCY)),
+        )
+
+    def _compile(self, options):
+        """Build the cover model for an options version."""
+        self.logger.debug("Compiling cover model")
+        self._update_options(options)
+        self.climate_data = ClimateCoverData(*self.get_climate_data(options))
+        self._snapshot_entities = [
+            "sun.sun",
+            self.start_time_entity,
+            self.end_time_entity,
+            *self.entities,
+            *self.climate_data.entity_ids,
+        ]
+        self.cover_model = self.get_blind_data(options=options)
+        self.normal_cover_state = NormalCoverState(self.cover_model)
+        self.climate_cover_state = ClimateCoverState(
+            self.cover_model, self.climate_data
+        )
+        self._compiled_options = options
+        self._async_update_time_window()
 
     def _update_manager_and_covers(self):
         self.manager.add_covers(self.entities)
@@ -509,64 +1355,68 @@ class AdaptiveDataUpdateCoordinator(DataUpdateCoordinator[AdaptiveCoverData]):
     @property
     def check_adaptive_time(self):
         """Check if time is within start and end times."""
-        if self._start_time and self._end_time and self._start_time > self._end_time:
-            self.logger.error("Start time is after end time")
-        return self.before_end_time and self.after_start_time
+        return self.time_window.contains(dt.datetime.now())
 
     @property
-    def after_start_time(self):
-        """Check if time is after start time."""
-        now = dt.datetime.now()
-        if self.start_time_entity is not None:
-            time = get_datetime_from_str(
-                get_safe_state(self.hass, self.start_time_entity)
-            )
-            self.logger.debug(
-                "Start time: %s, now: %s, now >= time: %s ", time, now, now >= time
-            )
-            self._start_time = time
-            return now >= time
-        if self.start_time is not None:
-            time = get_datetime_from_str(self.start_time)
+    def time_window(self) -> TimeWindow:
+        """Today's start and end time."""
+        return self._time_window
 
-            self.logger.debug(
-                "Start time: %s, now: %s, now >= time: %s", time, now, now >= time
+    @callback
+    def _async_update_time_window(self) -> None:
+        """Parse the start and end time again if they changed.
+
+        Runs when the options are compiled, when a start or end time entity
+        changes, at both edges and at midnight, which schedules the next
+        edges.
+        """
+        states = self.entity_states
+        start = (
+            states.safe_state(self.start_time_entity)
+            if self.start_time_entity is not None
+            else self.start_time
+        )
+        end = (
+            states.safe_state(self.end_time_entity)
+            if self.end_time_entity is not None
+            else self.end_time
+        )
+        key = (start, end, dt.date.today())
+        if key != self._time_window_key:
+            window = TimeWindow.from_strings(
+                start, end, end_from_entity=self.end_time_entity is not None
             )
-            self._start_time
-            return now >= time
-        return True
+            if window.start and window.end and window.start > window.end:
+                self.logger.error("Start time is after end time")
+            self._time_window = window
+            self._time_window_key = key
+            self._schedule_window_edges(window)
+
+    @property
+    def after_start_time(self):
+        """Check if time is after start time."""
+        return self.time_window.after_start(dt.datetime.now())
 
     @property
     def _end_time(self) -> dt.datetime | None:
         """Get end time."""
-        time = None
-        if self.end_time_entity is not None:
-            time = get_datetime_from_str(
-                get_safe_state(self.hass, self.end_time_entity)
-            )
-        elif self.end_time is not None:
-            time = get_datetime_from_str(self.end_time)
-            if time.time() == dt.time(0, 0):
-                time = time + dt.timedelta(days=1)
-        return time
+        return self.time_window.end
 
     @property
     def before_end_time(self):
         """Check if time is before end time."""
-        if self._end_time is not None:
-            now = dt.datetime.now()
-            self.logger.debug(
-                "End time: %s, now: %s, now < time: %s",
-                self._end_time,
-                now,
-                now < self._end_time,
-            )
-            return now < self._end_time
-        return True
+        return self.time_window.before_end(dt.datetime.now())
+
+    @property
+    def entity_states(self) -> EntitySnapshot:
+        """Entity states of the running refresh, or the current ones outside it."""
+        if self.snapshot is not None:
+            return self.snapshot
+        return self._live_states
 
     def _get_current_position(self, entity) -> int | None:
         """Get current position of cover."""
-        state = self.hass.states.get(entity)
+        state = self.entity_states.get(entity)
         if self._cover_type == "cover_tilt":
             return state.attributes.get("current_tilt_position") if state else None
         return state.attributes.get("current_position") if state else None
@@ -606,7 +1456,7 @@ class AdaptiveDataUpdateCoordinator(DataUpdateCoordinator[AdaptiveCoverData]):
     def check_time_delta(self, entity):
         """Check if time delta is passed."""
         now = dt.datetime.now(dt.UTC)
-        last_updated = get_last_updated(entity, self.hass)
+        last_updated = self.entity_states.last_updated(entity)
         if last_updated is not None:
             condition = now - last_updated >= dt.timedelta(minutes=self.time_threshold)
             self.logger.debug(
@@ -622,10 +1472,13 @@ class AdaptiveDataUpdateCoordinator(DataUpdateCoordinator[AdaptiveCoverData]):
     @property
     def pos_sun(self):
         """Fetch information for sun position."""
-        state = self.hass.states.get("sun.sun")
+        table = get_ephemeris_cache(self.hass).table
+        now = dt.datetime.now(dt.UTC)
+        if table is not None and table.covers(now.timestamp()):
+            return list(table.position(now))
         return [
-            state.attributes.get("azimuth") if state else None,
-            state.attributes.get("elevation") if state else None,
+            self.entity_states.attribute("sun.sun", "azimuth"),
+            self.entity_states.attribute("sun.sun", "elevation"),
         ]
 
     def common_data(self, options):
@@ -675,11 +1528,15 @@ class AdaptiveDataUpdateCoordinator(DataUpdateCoordinator[AdaptiveCoverData]):
             self._irradiance_toggle,
         ]
 
-    def climate_mode_data(self, options, cover_data):
+    def climate_mode_data(self):
         """Update climate mode data and control method."""
-        climate = ClimateCoverData(*self.get_climate_data(options))
-        self.climate_state = round(ClimateCoverState(cover_data, climate).get_state())
-        climate_data = ClimateCoverState(cover_data, climate).climate_data
+        climate_data = self.climate_data
+        climate_data.snapshot = self.snapshot
+        # the toggles are switch entities and may change between refreshes
+        climate_data.temp_switch = self._temp_toggle
+        climate_data._use_lux = self._lux_toggle
+        climate_data._use_irradiance = self._irradiance_toggle
+        self.climate_state = round(self.climate_cover_state.get_state())
         if climate_data.is_summer and self.switch_mode:
             self.control_method = "summer"
         if climate_data.is_winter and self.switch_mode:
@@ -750,7 +1607,7 @@ class AdaptiveDataUpdateCoordinator(DataUpdateCoordinator[AdaptiveCoverData]):
             normal_range = list(map(int, self.normal_list))
             new_range = list(map(int, self.new_list))
         if new_range:
-            state = np.interp(state, normal_range, new_range)
+            state = interpolate(state, normal_range, new_range)
             if state == new_range[0]:
                 state = 0
             if state == new_range[-1]:
@@ -823,6 +1680,11 @@ class AdaptiveCoverManager:
         self.manual_control_time: dict[str, dt.datetime] = {}
         self.reset_duration = dt.timedelta(**reset_duration)
         self.logger = logger
+        # covers under manual control, in the order they were taken over
+        self._manual: dict[str, None] = {}
+        # (deadline, cover) of manual overrides, entries are invalidated
+        # lazily when a cover is reset or its override is extended
+        self._deadlines: list[tuple[dt.datetime, str]] = []
 
     def add_covers(self, entity):
         """Update set with entities."""
@@ -855,6 +1717,14 @@ class AdaptiveCoverManager:
             new_position = new_state.attributes.get("current_position")
 
         if new_position != our_state:
+            if (
+                new_position is not None
+                and abs(our_state - new_position) <= TARGET_TOLERANCE
+            ):
+                self.logger.debug(
+                    "Position of %s is within tolerance of our state", entity_id
+                )
+                return
             if (
                 manual_threshold is not None
                 and abs(our_state - new_position) < manual_threshold
@@ -885,6 +1755,9 @@ class AdaptiveCoverManager:
         if entity_id not in self.manual_control_time or allow_reset:
             last_updated = new_state.last_updated
             self.manual_control_time[entity_id] = last_updated
+            heapq.heappush(
+                self._deadlines, (last_updated + self.reset_duration, entity_id)
+            )
             self.logger.debug(
                 "Updating last updated for manual control to %s for %s. Allow reset:%s",
                 last_updated,
@@ -898,16 +1771,50 @@ class AdaptiveCoverManager:
                 allow_reset,
             )
 
+    def as_dict(self) -> dict[str, str | None]:
+        """Serialize the covers under manual control with their start time."""
+        return {
+            entity: datetime_to_str(self.manual_control_time.get(entity))
+            for entity in self._manual
+        }
+
+    def restore(self, manual: dict[str, str | None]) -> None:
+        """Restore the covers under manual control saved by `as_dict`."""
+        for entity, since in manual.items():
+            self.mark_manual_control(entity)
+            if (last_updated := datetime_from_str(since)) is not None:
+                self.manual_control_time[entity] = last_updated
+                heapq.heappush(
+                    self._deadlines, (last_updated + self.reset_duration, entity)
+                )
+
     def mark_manual_control(self, cover: str) -> None:
         """Mark cover as under manual control."""
         self.manual_control[cover] = True
+        self._manual[cover] = None
+
+    def _is_current(self, deadline: dt.datetime, entity_id: str) -> bool:
+        """Check if a heap entry is the current deadline of a cover."""
+        last_updated = self.manual_control_time.get(entity_id)
+        return (
+            last_updated is not None and last_updated + self.reset_duration == deadline
+        )
+
+    @property
+    def next_expiry(self) -> dt.datetime | None:
+        """Earliest moment a manual override expires."""
+        deadlines = self._deadlines
+        while deadlines and not self._is_current(*deadlines[0]):
+            heapq.heappop(deadlines)
+        return deadlines[0][0] if deadlines else None
 
     async def reset_if_needed(self):
         """Reset manual control state of the covers."""
         current_time = dt.datetime.now(dt.UTC)
-        manual_control_time_copy = dict(self.manual_control_time)
-        for entity_id, last_updated in manual_control_time_copy.items():
-            if current_time - last_updated > self.reset_duration:
+        deadlines = self._deadlines
+        while deadlines and deadlines[0][0] <= current_time:
+            deadline, entity_id = heapq.heappop(deadlines)
+            if self._is_current(deadline, entity_id):
                 self.logger.debug(
                     "Resetting manual override for %s, because duration has elapsed",
                     entity_id,
@@ -918,6 +1825,7 @@ class AdaptiveCoverManager:
         """Reset manual control for a cover."""
         self.manual_control[entity_id] = False
         self.manual_control_time.pop(entity_id, None)
+        self._manual.pop(entity_id, None)
         self.logger.debug("Reset manual override for %s", entity_id)
 
     def is_cover_manual(self, entity_id):
@@ -927,12 +1835,12 @@ class AdaptiveCoverManager:
     @property
     def binary_cover_manual(self):
         """Check if any cover is under manual control."""
-        return any(value for value in self.manual_control.values())
+        return bool(self._manual)
 
     @property
     def manual_controlled(self):
         """Get the list of covers under manual control."""
-        return [k for k, v in self.manual_control.items() if v]
+        return list(self._manual)
 
 
 def inverse_state(state: int) -> int:
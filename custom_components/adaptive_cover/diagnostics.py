@@ -1,17 +1,48 @@
 """Adaptive Cover integration diagnostics."""
 
+import datetime as dt
+
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 
+from .const import DATA_COMMAND_QUEUE, DATA_SUN_DISPATCHER, DOMAIN
+
 
 async def async_get_config_entry_diagnostics(
     hass: HomeAssistant, config_entry: ConfigEntry
 ):
     """Return config entry diagnostics."""
-    return {
+    diagnostics = {
         "title": "Adaptive Cover Configuration",
         "type": "config_entry",
         "identifier": config_entry.entry_id,
         "config_data": config_entry.data,
         "config_options": config_entry.options,
     }
+    dispatcher = hass.data.get(DOMAIN, {}).get(DATA_SUN_DISPATCHER)
+    if dispatcher is not None:
+        diagnostics["sun_dispatcher"] = dict(dispatcher.stats)
+    queue = hass.data.get(DOMAIN, {}).get(DATA_COMMAND_QUEUE)
+    if queue is not None:
+        diagnostics["command_queue"] = {**queue.stats, "depth": queue.depth}
+    coordinator = hass.data.get(DOMAIN, {}).get(config_entry.entry_id)
+    if coordinator is not None:
+        diagnostics["startup"] = {
+            **coordinator.startup_stats,
+            "restored": coordinator.restored,
+        }
+        diagnostics["refresh_stats"] = dict(coordinator.refresh_stats)
+        diagnostics["dispatch_stats"] = dict(coordinator.dispatch_stats)
+        diagnostics["travel"] = {
+            entity: model.as_dict() for entity, model in coordinator.travel.items()
+        }
+        diagnostics["next_wakeup"] = (
+            coordinator.next_wakeup.isoformat() if coordinator.next_wakeup else None
+        )
+        diagnostics["decision_trace"] = coordinator.trace.as_list()
+        if coordinator.timeline is not None:
+            diagnostics["upcoming_changes"] = [
+                {"time": time.isoformat(), "state": state}
+                for time, state in coordinator.timeline.changes(dt.datetime.now(dt.UTC))
+            ]
+    return diagnostics
@@ -2,8 +2,6 @@
 
 import datetime as dt
 
-import pandas as pd
-from dateutil import parser
 from homeassistant.core import HomeAssistant, split_entity_id
 
 
@@ -22,15 +20,12 @@ def get_domain(entity: str):
         return domain
 
 
-def get_timedelta_str(string: str):
-    """Convert string to timedelta."""
-    if string is not None:
-        return pd.to_timedelta(string)
-
-
 def get_datetime_from_str(string: str):
     """Convert datetime string to datetime."""
     if string is not None:
+        # dateutil is only needed once times are parsed, not at import
+        from dateutil import parser  # pylint: disable=import-outside-toplevel
+
         return parser.parse(string, ignoretz=True)
 
 
@@ -41,6 +36,20 @@ def get_last_updated(entity_id: str, hass: HomeAssistant):
             return hass.states.get(entity_id).last_updated
 
 
+def interpolate(value: float, xp: list[float], fp: list[float]) -> float:
+    """Piecewise linear interpolation, clamped at the ends like numpy.interp."""
+    if value <= xp[0]:
+        return fp[0]
+    if value >= xp[-1]:
+        return fp[-1]
+    for x_low, x_high, f_low, f_high in zip(xp, xp[1:], fp, fp[1:]):
+        if x_low <= value <= x_high:
+            if x_high == x_low:
+                return f_high
+            return f_low + (value - x_low) * (f_high - f_low) / (x_high - x_low)
+    return fp[-1]
+
+
 def check_time_passed(time: dt.datetime):
     """Check if time is passed for datetime.time()."""
     now = dt.datetime.now().time()
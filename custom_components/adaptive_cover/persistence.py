@@ -0,0 +1,48 @@
+"""Runtime state of a config entry kept across restarts."""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+import datetime as dt
+from typing import Any
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import Store
+
+from .const import DOMAIN, STORAGE_SAVE_DELAY, STORAGE_VERSION
+
+
+def datetime_to_str(value: dt.datetime | None) -> str | None:
+    """Serialize an optional datetime."""
+    return value.isoformat() if value is not None else None
+
+
+def datetime_from_str(value: str | None) -> dt.datetime | None:
+    """Parse an optional datetime serialized with `datetime_to_str`."""
+    return dt.datetime.fromisoformat(value) if value is not None else None
+
+
+class RuntimeStore:
+    """Store the runtime state of a config entry, writes are debounced."""
+
+    def __init__(self, hass: HomeAssistant, entry_id: str) -> None:  # noqa: D107
+        self._store: Store[dict[str, Any]] = Store(
+            hass, STORAGE_VERSION, f"{DOMAIN}.{entry_id}"
+        )
+
+    async def async_load(self) -> dict[str, Any] | None:
+        """Load the saved state, None if there is none."""
+        return await self._store.async_load()
+
+    @callback
+    def async_schedule_save(self, data_func: Callable[[], dict[str, Any]]) -> None:
+        """Save the state returned by `data_func` after a short delay.
+
+        Changes within the delay are written together, pending writes are
+        flushed when Home Assistant stops.
+        """
+        self._store.async_delay_save(data_func, STORAGE_SAVE_DELAY)
+
+    async def async_remove(self) -> None:
+        """Remove the saved state."""
+        await self._store.async_remove()
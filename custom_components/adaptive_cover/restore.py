@@ -0,0 +1,35 @@
+"""Coordinator entities that show their last state after a restart."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
+
+from .coordinator import AdaptiveDataUpdateCoordinator
+
+
+class RestoredCoordinatorEntity(CoordinatorEntity[AdaptiveDataUpdateCoordinator]):
+    """Show the state restored from before the restart until the first refresh.
+
+    Combine with RestoreEntity or RestoreSensor and implement
+    `async_get_restored_value`.
+    """
+
+    _restored: Any = None
+
+    async def async_get_restored_value(self) -> Any:
+        """Return the value saved before the restart, None if there is none."""
+        raise NotImplementedError
+
+    async def async_added_to_hass(self) -> None:
+        """Restore the last state until the first state is computed."""
+        await super().async_added_to_hass()
+        self._restored = await self.async_get_restored_value()
+
+    @property
+    def available(self) -> bool:
+        """Unavailable until the first state is computed or restored."""
+        return super().available and (
+            self.coordinator.data is not None or self._restored is not None
+        )
@@ -6,8 +6,8 @@ from collections.abc import Mapping
 from typing import Any
 
 from homeassistant.components.sensor import (
+    RestoreSensor,
     SensorDeviceClass,
-    SensorEntity,
     SensorStateClass,
 )
 from homeassistant.config_entries import ConfigEntry
@@ -16,13 +16,13 @@ from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.device_registry import DeviceEntryType
 from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import (
     CONF_SENSOR_TYPE,
     DOMAIN,
 )
 from .coordinator import AdaptiveDataUpdateCoordinator
+from .restore import RestoredCoordinatorEntity
 
 
 async def async_setup_entry(
@@ -66,9 +66,17 @@ async def async_setup_entry(
     async_add_entities([sensor, start, end, control])
 
 
-class AdaptiveCoverSensorEntity(
-    CoordinatorEntity[AdaptiveDataUpdateCoordinator], SensorEntity
-):
+class AdaptiveCoverRestoredSensor(RestoredCoordinatorEntity, RestoreSensor):
+    """Sensor showing its last value until the first refresh."""
+
+    async def async_get_restored_value(self) -> Any:
+        """Return the value saved before the restart."""
+        if (last := await self.async_get_last_sensor_data()) is not None:
+            return last.native_value
+        return None
+
+
+class AdaptiveCoverSensorEntity(AdaptiveCoverRestoredSensor):
     """Adaptive Cover Sensor."""
 
     _attr_state_class = SensorStateClass.MEASUREMENT
@@ -116,6 +124,8 @@ class AdaptiveCoverSensorEntity(
     @property
     def native_value(self) -> str | None:
         """Handle when entity is added."""
+        if self.data is None:
+            return self._restored
         return self.data.states["state"]
 
     @property
@@ -129,12 +139,10 @@ class AdaptiveCoverSensorEntity(
 
     @property
     def extra_state_attributes(self) -> Mapping[str, Any] | None:  # noqa: D102
-        return self.data.attributes
+        return self.data.attributes if self.data is not None else None
 
 
-class AdaptiveCoverTimeSensorEntity(
-    CoordinatorEntity[AdaptiveDataUpdateCoordinator], SensorEntity
-):
+class AdaptiveCoverTimeSensorEntity(AdaptiveCoverRestoredSensor):
     """Adaptive Cover Time Sensor."""
 
     _attr_device_class = SensorDeviceClass.TIMESTAMP
@@ -186,6 +194,8 @@ class AdaptiveCoverTimeSensorEntity(
     @property
     def native_value(self) -> str | None:
         """Handle when entity is added."""
+        if self.data is None:
+            return self._restored
         return self.data.states[self.key]
 
     @property
@@ -198,9 +208,7 @@ class AdaptiveCoverTimeSensorEntity(
         )
 
 
-class AdaptiveCoverControlSensorEntity(
-    CoordinatorEntity[AdaptiveDataUpdateCoordinator], SensorEntity
-):
+class AdaptiveCoverControlSensorEntity(AdaptiveCoverRestoredSensor):
     """Adaptive Cover Control method Sensor."""
 
     _attr_has_entity_name = True
@@ -248,6 +256,8 @@ class AdaptiveCoverControlSensorEntity(
     @property
     def native_value(self) -> str | None:
         """Handle when entity is added."""
+        if self.data is None:
+            return self._restored
         return self.data.states["control"]
 
     @property
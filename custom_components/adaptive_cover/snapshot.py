@@ -0,0 +1,101 @@
+"""Immutable snapshot of the entity states used during one refresh."""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Iterator, Mapping
+from dataclasses import dataclass
+import datetime as dt
+from types import MappingProxyType
+from typing import Any
+
+from homeassistant.core import HomeAssistant, State
+
+UNAVAILABLE_STATES = ("unknown", "unavailable")
+
+
+def _to_float(state: State | None) -> float | None:
+    """Parse a numeric state, None if it is missing or not a number."""
+    if state is None or state.state in UNAVAILABLE_STATES:
+        return None
+    try:
+        return float(state.state)
+    except ValueError:
+        return None
+
+
+class _LiveStates(Mapping[str, State | None]):
+    """Current states looked up on access, parsed as float if `numbers`."""
+
+    __slots__ = ("_hass", "_numbers")
+
+    def __init__(self, hass: HomeAssistant, numbers: bool = False) -> None:  # noqa: D107
+        self._hass = hass
+        self._numbers = numbers
+
+    def __getitem__(self, entity_id: str) -> Any:
+        state = self._hass.states.get(entity_id)
+        return _to_float(state) if self._numbers else state
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._hass.states.async_entity_ids())
+
+    def __len__(self) -> int:
+        return self._hass.states.async_entity_ids_count()
+
+
+@dataclass(frozen=True, slots=True)
+class EntitySnapshot:
+    """Entity states captured once at the start of a refresh.
+
+    Home Assistant replaces `State` objects instead of mutating them, so
+    keeping references gives consistent reads for the whole refresh. Numeric
+    states are parsed once while capturing.
+    """
+
+    states: Mapping[str, State | None]
+    numbers: Mapping[str, float | None]
+
+    @classmethod
+    def capture(
+        cls, hass: HomeAssistant, entity_ids: Iterable[str | None]
+    ) -> EntitySnapshot:
+        """Read the states of the given entities, skipping None."""
+        states: dict[str, State | None] = {}
+        numbers: dict[str, float | None] = {}
+        for entity_id in entity_ids:
+            if entity_id is None or entity_id in states:
+                continue
+            state = hass.states.get(entity_id)
+            states[entity_id] = state
+            numbers[entity_id] = _to_float(state)
+        return cls(MappingProxyType(states), MappingProxyType(numbers))
+
+    @classmethod
+    def live(cls, hass: HomeAssistant) -> EntitySnapshot:
+        """Read the current state of an entity on every lookup instead."""
+        return cls(_LiveStates(hass), _LiveStates(hass, numbers=True))
+
+    def get(self, entity_id: str | None) -> State | None:
+        """Get the captured state object of an entity."""
+        return self.states.get(entity_id)
+
+    def safe_state(self, entity_id: str | None) -> str | None:
+        """Get the state value, None if it is unknown or unavailable."""
+        state = self.states.get(entity_id)
+        if state is None or state.state in UNAVAILABLE_STATES:
+            return None
+        return state.state
+
+    def number(self, entity_id: str | None) -> float | None:
+        """Get the state value parsed as float."""
+        return self.numbers.get(entity_id)
+
+    def attribute(self, entity_id: str | None, attribute: str) -> Any:
+        """Get an attribute of an entity."""
+        state = self.states.get(entity_id)
+        return state.attributes.get(attribute) if state else None
+
+    def last_updated(self, entity_id: str | None) -> dt.datetime | None:
+        """Get the last updated time of an entity."""
+        state = self.states.get(entity_id)
+        return state.last_updated if state else None
@@ -0,0 +1,164 @@
+"""Vectorized solar position engine."""
+
+from __future__ import annotations
+
+from datetime import datetime
+
+import numpy as np
+
+SECONDS_PER_DAY = 86400
+JULIAN_UNIX_EPOCH = 2440587.5
+JULIAN_J2000 = 2451545.0
+
+
+def to_utc_seconds(times) -> np.ndarray:
+    """Convert timestamps to float seconds since the Unix epoch (UTC).
+
+    Accepts numeric arrays (already in seconds), numpy datetime64 arrays
+    (assumed UTC), timezone aware DatetimeIndex objects or sequences of
+    aware datetimes.
+    """
+    if isinstance(times, np.ndarray) and times.dtype.kind in "fi":
+        return times.astype(np.float64)
+    if isinstance(times, datetime):
+        times = [times]
+    if isinstance(times, (list, tuple)):
+        return np.array([time.timestamp() for time in times], dtype=np.float64)
+    values = np.asarray(times, dtype="datetime64[ns]")
+    return values.astype(np.int64) / 1e9
+
+
+def _noaa_declination_eqtime(jc: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Sun declination (deg) and equation of time (min), NOAA formulation."""
+    l0 = (280.46646 + jc * (36000.76983 + 0.0003032 * jc)) % 360.0
+    m = np.radians(357.52911 + jc * (35999.05029 - 0.0001537 * jc))
+    e = 0.016708634 - jc * (0.000042037 + 0.0000001267 * jc)
+
+    c = (
+        np.sin(m) * (1.914602 - jc * (0.004817 + 0.000014 * jc))
+        + np.sin(2 * m) * (0.019993 - 0.000101 * jc)
+        + np.sin(3 * m) * 0.000289
+    )
+    omega = np.radians(125.04 - 1934.136 * jc)
+    apparent_long = np.radians(l0 + c - 0.00569 - 0.00478 * np.sin(omega))
+
+    seconds = 21.448 - jc * (46.815 + jc * (0.00059 - jc * 0.001813))
+    obliquity = np.radians(
+        23.0 + (26.0 + seconds / 60.0) / 60.0 + 0.00256 * np.cos(omega)
+    )
+
+    declination = np.degrees(np.arcsin(np.sin(obliquity) * np.sin(apparent_long)))
+
+    y = np.tan(obliquity / 2.0) ** 2
+    l0 = np.radians(l0)
+    eqtime = 4.0 * np.degrees(
+        y * np.sin(2 * l0)
+        - 2 * e * np.sin(m)
+        + 4 * e * y * np.sin(m) * np.cos(2 * l0)
+        - 0.5 * y * y * np.sin(4 * l0)
+        - 1.25 * e * e * np.sin(2 * m)
+    )
+    return declination, eqtime
+
+
+def refraction(elevation: np.ndarray) -> np.ndarray:
+    """Atmospheric refraction correction in degrees for a geometric elevation."""
+    with np.errstate(divide="ignore", invalid="ignore"):
+        te = np.tan(np.radians(elevation))
+        high = 58.1 / te - 0.07 / te**3 + 0.000086 / te**5
+        low = 1735.0 + elevation * (
+            -518.2 + elevation * (103.4 + elevation * (-12.79 + elevation * 0.711))
+        )
+        below = -20.774 / te
+    correction = np.select(
+        [elevation >= 85.0, elevation > 5.0, elevation > -0.575],
+        [0.0, high, low],
+        below,
+    )
+    return correction / 3600.0
+
+
+def solar_position(
+    times,
+    latitude: float,
+    longitude: float,
+    with_refraction: bool = True,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Compute solar azimuth and elevation for an array of timestamps.
+
+    Returns two float arrays (azimuth clockwise from north, elevation above
+    the horizon) in degrees, one value per timestamp. It follows the NOAA
+    algorithm used by astral and matches it to floating point precision.
+    """
+    seconds = to_utc_seconds(times)
+    jc = (seconds / SECONDS_PER_DAY + JULIAN_UNIX_EPOCH - JULIAN_J2000) / 36525.0
+    declination, eqtime = _noaa_declination_eqtime(jc)
+
+    latitude = np.clip(latitude, -89.8, 89.8)
+    minutes = (seconds % SECONDS_PER_DAY) / 60.0
+    true_solar_time = (minutes + eqtime + 4.0 * longitude) % 1440.0
+    hour_angle = np.radians(true_solar_time / 4.0 - 180.0)
+
+    lat = np.radians(latitude)
+    decl = np.radians(declination)
+    cos_zenith = np.clip(
+        np.sin(lat) * np.sin(decl) + np.cos(lat) * np.cos(decl) * np.cos(hour_angle),
+        -1.0,
+        1.0,
+    )
+    elevation = 90.0 - np.degrees(np.arccos(cos_zenith))
+    azimuth = (
+        np.degrees(
+            np.arctan2(
+                np.sin(hour_angle),
+                np.cos(hour_angle) * np.sin(lat) - np.tan(decl) * np.cos(lat),
+            )
+        )
+        + 180.0
+    ) % 360.0
+
+    if with_refraction:
+        elevation = elevation + refraction(elevation)
+    return azimuth, elevation
+
+
+def find_intervals(
+    seconds: np.ndarray,
+    inside: np.ndarray,
+    evaluate,
+    tolerance: float = 1.0,
+) -> list[tuple[float, float]]:
+    """Find the intervals in which a condition holds.
+
+    `inside` is the condition sampled on the ascending grid `seconds` (UTC
+    seconds). Every change between two neighbouring samples is refined by
+    bisection until it is known within `tolerance` seconds; `evaluate` maps
+    an array of timestamps to booleans and is called once per bisection
+    step for all edges together.
+    """
+    seconds = np.asarray(seconds, dtype=np.float64)
+    inside = np.asarray(inside, dtype=bool)
+    changes = np.flatnonzero(inside[1:] != inside[:-1])
+    rising = ~inside[changes]
+    low = seconds[changes]
+    high = seconds[changes + 1]
+
+    while changes.size and np.max(high - low) > tolerance:
+        middle = (low + high) / 2
+        # the edge is before the middle if the condition already changed there
+        passed = np.asarray(evaluate(middle), dtype=bool) == rising
+        high = np.where(passed, middle, high)
+        low = np.where(passed, low, middle)
+    edges = (low + high) / 2
+
+    intervals = []
+    start = seconds[0] if inside[0] else None
+    for edge, entering in zip(edges, rising):
+        if entering:
+            start = edge
+        elif start is not None:
+            intervals.append((float(start), float(edge)))
+            start = None
+    if start is not None:
+        intervals.append((float(start), float(seconds[-1])))
+    return intervals
@@ -1,67 +1,414 @@
 """Fetch sun data."""
 
-from datetime import date, datetime, timedelta
+import asyncio
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import UTC, date, datetime, time, timedelta
+from pathlib import Path
+from threading import Lock
+from zoneinfo import ZoneInfo
 
-import pandas as pd
+import numpy as np
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers.storage import STORAGE_DIR
 from homeassistant.helpers.sun import get_astral_location
 
+from .const import (
+    _LOGGER,
+    DATA_EPHEMERIS,
+    DATA_EPHEMERIS_LOCK,
+    DOMAIN,
+    EPHEMERIS_CACHE_DAYS,
+    EPHEMERIS_TABLE_RESOLUTION,
+)
+from .solar import find_intervals, solar_position, to_utc_seconds
+
+
+@dataclass(frozen=True)
+class DayEphemeris:
+    """Sun data of one day for one location."""
+
+    times: np.ndarray
+    azimuth: np.ndarray
+    elevation: np.ndarray
+    sunrise: datetime | None
+    sunset: datetime | None
+
+
+def _sun_event(event, day: date) -> datetime | None:
+    """Get sunrise or sunset, None on polar days and nights without one."""
+    try:
+        return event(day, local=False)
+    except ValueError:
+        return None
+
+
+class EphemerisTable:
+    """Memory-mapped table of sun positions for one location and year.
+
+    Rows hold float32 (azimuth, elevation) pairs every `step` seconds from
+    one day before until one day after the (UTC) calendar year, so every
+    local date of that year is covered. Lookups interpolate between the
+    two neighbouring rows.
+    """
+
+    def __init__(  # noqa: D107
+        self,
+        data: np.ndarray,
+        latitude: float,
+        longitude: float,
+        year: int,
+        step: float,
+    ) -> None:
+        self.data = data
+        self.latitude = latitude
+        self.longitude = longitude
+        self.year = year
+        self.step = step
+        self.start = self.year_start(year) - 86400
+
+    @staticmethod
+    def year_start(year: int) -> float:
+        """Return the first second of a UTC year."""
+        return datetime(year, 1, 1, tzinfo=UTC).timestamp()
+
+    @staticmethod
+    def filename(latitude: float, longitude: float, year: int) -> str:
+        """Return the storage file name for a location and year."""
+        return (
+            f"{DOMAIN}.ephemeris.{EPHEMERIS_TABLE_RESOLUTION}min"
+            f".{latitude:.4f}_{longitude:.4f}.{year}.npy"
+        )
+
+    @classmethod
+    def load_or_create(
+        cls, directory: str, latitude: float, longitude: float, year: int
+    ) -> "EphemerisTable":
+        """Map the table for a location and year, generating it if needed.
+
+        This does blocking I/O and must run in the executor.
+        """
+        step = EPHEMERIS_TABLE_RESOLUTION * 60
+        start = cls.year_start(year) - 86400
+        rows = int((cls.year_start(year + 1) + 86400 - start) // step) + 1
+        path = Path(directory) / cls.filename(latitude, longitude, year)
+
+        data = None
+        if path.exists():
+            try:
+                data = np.load(path, mmap_mode="r")
+            except ValueError:
+                data = None
+            if data is not None and data.shape != (rows, 2):
+                data = None
+
+        if data is None:
+            _LOGGER.debug("Generating ephemeris table %s", path)
+            seconds = start + np.arange(rows, dtype=np.float64) * step
+            azimuth, elevation = solar_position(
+                (seconds * 1e9).astype("datetime64[ns]"), latitude, longitude
+            )
+            table = np.column_stack((azimuth, elevation)).astype(np.float32)
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_suffix(".tmp")
+            with tmp_path.open("wb") as file:
+                np.save(file, table)
+            tmp_path.replace(path)
+            # only keep the table that is in use
+            for old in path.parent.glob(f"{DOMAIN}.ephemeris.*.npy"):
+                if old != path:
+                    old.unlink(missing_ok=True)
+            data = np.load(path, mmap_mode="r")
+
+        return cls(data, latitude, longitude, year, step)
+
+    def matches(self, latitude: float, longitude: float, year: int) -> bool:
+        """Check if the table belongs to a location and year."""
+        return (
+            round(self.latitude, 4) == round(latitude, 4)
+            and round(self.longitude, 4) == round(longitude, 4)
+            and self.year == year
+        )
+
+    def covers(self, seconds) -> bool:
+        """Check if all timestamps (UTC seconds) fall within the table."""
+        seconds = np.asarray(seconds)
+        end = self.start + (len(self.data) - 1) * self.step
+        return bool(np.all((seconds >= self.start) & (seconds <= end)))
+
+    def interpolate(self, seconds) -> tuple[np.ndarray, np.ndarray]:
+        """Interpolate azimuth and elevation for timestamps in UTC seconds."""
+        position = (np.asarray(seconds, dtype=np.float64) - self.start) / self.step
+        index = np.clip(np.floor(position).astype(np.int64), 0, len(self.data) - 2)
+        fraction = position - index
+        low = self.data[index].astype(np.float64)
+        high = self.data[index + 1].astype(np.float64)
+        # interpolate azimuth along the shortest arc to handle the 360 wrap
+        delta_azimuth = (high[..., 0] - low[..., 0] + 180) % 360 - 180
+        azimuth = (low[..., 0] + fraction * delta_azimuth) % 360
+        elevation = low[..., 1] + fraction * (high[..., 1] - low[..., 1])
+        return azimuth, elevation
+
+    def position(self, when: datetime) -> tuple[float, float]:
+        """Return sun azimuth and elevation at a single moment."""
+        position = (when.timestamp() - self.start) / self.step
+        index = min(max(int(position), 0), len(self.data) - 2)
+        fraction = position - index
+        (azi_low, elev_low), (azi_high, elev_high) = self.data[
+            index : index + 2
+        ].tolist()
+        delta_azimuth = (azi_high - azi_low + 180) % 360 - 180
+        return (
+            (azi_low + fraction * delta_azimuth) % 360,
+            elev_low + fraction * (elev_high - elev_low),
+        )
+
+
+class EphemerisCache:
+    """Share daily sun data between all config entries.
+
+    Entries are keyed by location, timezone and date and evicted in least
+    recently used order once more than `max_days` days are cached.
+    """
+
+    def __init__(self, max_days: int = EPHEMERIS_CACHE_DAYS) -> None:  # noqa: D107
+        self.max_days = max_days
+        self.table: EphemerisTable | None = None
+        self._days: OrderedDict[tuple, DayEphemeris] = OrderedDict()
+        # solar times are computed in the executor, so guard the dict
+        self._lock = Lock()
+        # days being computed in the executor for entries starting together
+        self.warming: dict[tuple, asyncio.Future[DayEphemeris]] = {}
+
+    def get_day(
+        self,
+        location,
+        elevation: float,
+        timezone: str,
+        day: date,
+    ) -> DayEphemeris:
+        """Return (and memoize) the sun data for a location and date."""
+        key = (
+            location.latitude,
+            location.longitude,
+            elevation,
+            timezone,
+            day,
+        )
+        with self._lock:
+            ephemeris = self._days.get(key)
+            if ephemeris is not None:
+                self._days.move_to_end(key)
+                return ephemeris
+
+        ephemeris = self._compute_day(location, timezone, day, self.table)
+
+        with self._lock:
+            self._days[key] = ephemeris
+            self._days.move_to_end(key)
+            while len(self._days) > self.max_days:
+                self._days.popitem(last=False)
+        return ephemeris
+
+    @staticmethod
+    def _compute_day(
+        location,
+        timezone: str,
+        day: date,
+        table: EphemerisTable | None = None,
+    ):
+        """Compute time grid, sun position and sunrise/sunset for a date."""
+        zone = ZoneInfo(str(timezone))
+        start = datetime.combine(day, time(), zone).timestamp()
+        end = datetime.combine(day + timedelta(days=1), time(), zone).timestamp()
+        seconds = np.arange(start, end + 1, 300, dtype=np.float64)
+        times = seconds.astype("datetime64[s]")
+        if (
+            table is not None
+            and table.matches(location.latitude, location.longitude, day.year)
+            and table.covers(seconds)
+        ):
+            azimuth, elevation = table.interpolate(seconds)
+        else:
+            azimuth, elevation = solar_position(
+                seconds, location.latitude, location.longitude
+            )
+        # arrays are shared between config entries, keep them read-only
+        times.flags.writeable = False
+        azimuth.flags.writeable = False
+        elevation.flags.writeable = False
+        return DayEphemeris(
+            times=times,
+            azimuth=azimuth,
+            elevation=elevation,
+            sunrise=_sun_event(location.sunrise, day),
+            sunset=_sun_event(location.sunset, day),
+        )
+
+    def clear(self) -> None:
+        """Drop all cached days."""
+        with self._lock:
+            self._days.clear()
+
+
+def get_ephemeris_cache(hass: HomeAssistant) -> EphemerisCache:
+    """Get the ephemeris cache shared by all config entries."""
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    if DATA_EPHEMERIS not in domain_data:
+        domain_data[DATA_EPHEMERIS] = EphemerisCache()
+    return domain_data[DATA_EPHEMERIS]
+
+
+async def async_warmup_sun_data(hass: HomeAssistant) -> None:
+    """Compute today's sun data of the configured location in the executor.
+
+    Entries starting together share one computation per location, their
+    later lookups are served from the cache.
+    """
+    cache = get_ephemeris_cache(hass)
+    location, elevation = get_astral_location(hass)
+    timezone = hass.config.time_zone
+    day = date.today()
+    key = (location.latitude, location.longitude, elevation, timezone, day)
+    pending = cache.warming.get(key)
+    if pending is None:
+        pending = cache.warming[key] = hass.async_add_executor_job(
+            cache.get_day, location, elevation, timezone, day
+        )
+        pending.add_done_callback(lambda _: cache.warming.pop(key, None))
+    await asyncio.shield(pending)
+
+
+async def async_get_ephemeris_table(hass: HomeAssistant) -> EphemerisTable | None:
+    """Load the yearly ephemeris table of the configured location.
+
+    The table is generated once under `.storage` and memory-mapped, all
+    config entries share the same instance through the ephemeris cache.
+    """
+    cache = get_ephemeris_cache(hass)
+    location, _ = get_astral_location(hass)
+    year = date.today().year
+    table = cache.table
+    if table is not None and table.matches(location.latitude, location.longitude, year):
+        return table
+
+    lock = hass.data[DOMAIN].setdefault(DATA_EPHEMERIS_LOCK, asyncio.Lock())
+    async with lock:
+        table = cache.table
+        if table is None or not table.matches(
+            location.latitude, location.longitude, year
+        ):
+            try:
+                table = await hass.async_add_executor_job(
+                    EphemerisTable.load_or_create,
+                    hass.config.path(STORAGE_DIR),
+                    location.latitude,
+                    location.longitude,
+                    year,
+                )
+            except OSError as err:
+                _LOGGER.warning("Could not load ephemeris table: %s", err)
+                return None
+            cache.table = table
+    return table
+
 
 class SunData:
     """Access local sun data."""
 
-    def __init__(self, timezone, hass: HomeAssistant) -> None:  # noqa: D107
+    def __init__(  # noqa: D107
+        self,
+        timezone,
+        hass: HomeAssistant,
+    ) -> None:
         self.hass = hass
         location, elevation = get_astral_location(self.hass)
         self.location = location  # astral.location.Location
         self.elevation = elevation
         self.timezone = timezone
+        self._cache = get_ephemeris_cache(hass)
 
     @property
-    def times(self) -> pd.DatetimeIndex:
+    def today(self) -> DayEphemeris:
+        """Get the shared sun data of today."""
+        return self._cache.get_day(
+            self.location,
+            self.elevation,
+            self.timezone,
+            date.today(),
+        )
+
+    @property
+    def times(self) -> np.ndarray:
         """Define time interval."""
-        start_date = date.today()
-        end_date = start_date + timedelta(days=1)
+        return self.today.times
 
-        times = pd.date_range(
-            start=start_date, end=end_date, freq="5min", tz=self.timezone, name="time"
-        )
-        return times
+    @property
+    def solar_azimuth(self) -> np.ndarray:
+        """Create array with solar azimuth data per 5 minutes."""
+        return self.today.azimuth
 
     @property
-    def solar_azimuth(self) -> list:
-        """Create list with solar azimuth data per 5 minutes."""
-        index = 0
-        azi_list = []
-        for _i in self.times:
-            azi_list.append(
-                self.location.solar_azimuth(self.times[index], self.elevation)
+    def solar_elevation(self) -> np.ndarray:
+        """Create array with solar elevation data per 5 minutes."""
+        return self.today.elevation
+
+    def position_at(self, seconds) -> tuple[np.ndarray, np.ndarray]:
+        """Get sun azimuth and elevation for timestamps in UTC seconds."""
+        seconds = np.asarray(seconds, dtype=np.float64)
+        table = self._cache.table
+        if (
+            table is not None
+            and table.matches(
+                self.location.latitude, self.location.longitude, table.year
             )
-            index += 1
-        return azi_list
+            and table.covers(seconds)
+        ):
+            return table.interpolate(seconds)
+        return solar_position(seconds, self.location.latitude, self.location.longitude)
 
-    @property
-    def solar_elevation(self) -> list:
-        """Create list with solar elevation data per 5 minutes."""
-        index = 0
-        ele_list = []
-        for _i in self.times:
-            ele_list.append(
-                self.location.solar_elevation(self.times[index], self.elevation)
+    def intervals(self, mask) -> list[tuple[datetime, datetime]]:
+        """Find today's intervals in which `mask(azimuth, elevation)` holds.
+
+        The 5 minute grid brackets every entry and exit, which are then
+        bisected to within a second.
+        """
+        edges = find_intervals(
+            to_utc_seconds(self.times),
+            mask(self.solar_azimuth, self.solar_elevation),
+            lambda seconds: mask(*self.position_at(seconds)),
+        )
+        return [
+            (
+                datetime.fromtimestamp(round(start), UTC),
+                datetime.fromtimestamp(round(end), UTC),
             )
-            index += 1
-        return ele_list
+            for start, end in edges
+        ]
+
+    def _day_edge(self, end: bool) -> datetime:
+        """Get the start or end of today's time grid."""
+        seconds = to_utc_seconds(self.times)
+        return datetime.fromtimestamp(seconds[-1 if end else 0], UTC)
 
     def sunset(self) -> datetime:
-        """Fetch sunset time."""
-        return self.location.sunset(date.today(), local=False)
+        """Fetch sunset time.
+
+        Without a sunset the sun is up until the end of the day, or during
+        polar night down since its start.
+        """
+        today = self.today
+        if today.sunset is not None:
+            return today.sunset
+        return self._day_edge(end=bool(today.elevation.max() > 0))
 
     def sunrise(self) -> datetime:
-        """Fetch sunrise time."""
-        return self.location.sunrise(date.today(), local=False)
-
-    # def df_today(self)-> pd.DataFrame:
-    #     """Create dataframe with azimuth and elevation data"""
-    #     df_today = pd.DataFrame({"azimuth":self.solar_azimuth, "elevation":self.solar_elevation})
-    #     df_today = df_today.set_index(self.times)
-    #     return df_today
+        """Fetch sunrise time.
+
+        Without a sunrise the sun is up since the start of the day, or during
+        polar night not up before its end.
+        """
+        today = self.today
+        if today.sunrise is not None:
+            return today.sunrise
+        return self._day_edge(end=bool(today.elevation.max() <= 0))
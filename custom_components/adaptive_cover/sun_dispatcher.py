@@ -0,0 +1,104 @@
+"""Single sun.sun listener shared by all config entries."""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+import time
+
+from homeassistant.core import (
+    CALLBACK_TYPE,
+    Event,
+    EventStateChangedData,
+    HomeAssistant,
+    State,
+    callback,
+)
+from homeassistant.helpers.event import async_track_state_change_event
+
+from .const import (
+    _LOGGER,
+    DATA_SUN_DISPATCHER,
+    DOMAIN,
+    REFRESH_COALESCE_WINDOW,
+    SUN_FANOUT_BATCH,
+    SUN_FANOUT_STAGGER,
+)
+
+
+def sun_position_changed(old_state: State | None, new_state: State | None) -> bool:
+    """Check if a sun.sun update changed anything the covers depend on."""
+    if old_state is None or new_state is None or old_state.state != new_state.state:
+        return True
+    return any(
+        old_state.attributes.get(attr) != new_state.attributes.get(attr)
+        for attr in ("azimuth", "elevation")
+    )
+
+
+class SunDispatcher:
+    """Notify the config entries of sun position updates.
+
+    Updates that do not move the sun are dropped once for all entries. The
+    entries are notified in batches, each batch refreshing slightly later
+    than the previous one so they do not all refresh at the same moment.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:  # noqa: D107
+        self.hass = hass
+        self._subscribers: dict[str, Callable[[float], None]] = {}
+        self._unsub: CALLBACK_TYPE | None = None
+        self.stats = {
+            "updates": 0,
+            "ignored": 0,
+            "last_woken": 0,
+            "last_duration": None,
+        }
+
+    @callback
+    def async_subscribe(
+        self, entry_id: str, action: Callable[[float], None]
+    ) -> CALLBACK_TYPE:
+        """Call `action` with a refresh delay on sun updates until unsubscribed."""
+        self._subscribers[entry_id] = action
+        if self._unsub is None:
+            self._unsub = async_track_state_change_event(
+                self.hass, ["sun.sun"], self._async_sun_changed
+            )
+
+        @callback
+        def unsubscribe() -> None:
+            self._subscribers.pop(entry_id, None)
+            if not self._subscribers and self._unsub is not None:
+                self._unsub()
+                self._unsub = None
+
+        return unsubscribe
+
+    @callback
+    def _async_sun_changed(self, event: Event[EventStateChangedData]) -> None:
+        """Fan a sun.sun update out to all subscribed entries."""
+        if not sun_position_changed(event.data["old_state"], event.data["new_state"]):
+            self.stats["ignored"] += 1
+            return
+        started = time.monotonic()
+        subscribers = list(self._subscribers.values())
+        for index, action in enumerate(subscribers):
+            action(
+                REFRESH_COALESCE_WINDOW
+                + (index // SUN_FANOUT_BATCH) * SUN_FANOUT_STAGGER
+            )
+        duration = time.monotonic() - started
+        self.stats["updates"] += 1
+        self.stats["last_woken"] = len(subscribers)
+        self.stats["last_duration"] = round(duration, 6)
+        _LOGGER.debug(
+            "Notified %s entries of sun update in %.6f s", len(subscribers), duration
+        )
+
+
+def get_sun_dispatcher(hass: HomeAssistant) -> SunDispatcher:
+    """Get the sun.sun dispatcher shared by all config entries."""
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    if DATA_SUN_DISPATCHER not in domain_data:
+        domain_data[DATA_SUN_DISPATCHER] = SunDispatcher(hass)
+    return domain_data[DATA_SUN_DISPATCHER]
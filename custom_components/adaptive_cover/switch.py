@@ -178,7 +178,7 @@ class AdaptiveCoverSwitch(
         setattr(self.coordinator, self._key, False)
         if self._key == "control_toggle" and kwargs.get("added") is not True:
             for entity in self.coordinator.manager.manual_controlled:
-                self.coordinator.manager.reset(entity)
+                self.coordinator.async_reset_manual(entity)
         await self.coordinator.async_refresh()
         self.schedule_update_ha_state()
 
@@ -0,0 +1,45 @@
+"""Start and end times between which the covers are controlled."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+import datetime as dt
+
+from .helpers import get_datetime_from_str
+
+
+@dataclass(frozen=True, slots=True)
+class TimeWindow:
+    """Parsed start and end time, as naive local datetimes."""
+
+    start: dt.datetime | None = None
+    end: dt.datetime | None = None
+
+    @classmethod
+    def from_strings(
+        cls, start: str | None, end: str | None, end_from_entity: bool = False
+    ) -> TimeWindow:
+        """Parse the configured or entity provided start and end time.
+
+        A configured end time of midnight means the end of the day.
+        """
+        end_time = get_datetime_from_str(end)
+        if (
+            end_time is not None
+            and not end_from_entity
+            and end_time.time() == dt.time(0, 0)
+        ):
+            end_time = end_time + dt.timedelta(days=1)
+        return cls(get_datetime_from_str(start), end_time)
+
+    def after_start(self, now: dt.datetime) -> bool:
+        """Check if the start time has passed."""
+        return self.start is None or now >= self.start
+
+    def before_end(self, now: dt.datetime) -> bool:
+        """Check if the end time has not passed yet."""
+        return self.end is None or now < self.end
+
+    def contains(self, now: dt.datetime) -> bool:
+        """Check if covers may be controlled at `now`."""
+        return self.after_start(now) and self.before_end(now)
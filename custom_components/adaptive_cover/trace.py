@@ -0,0 +1,66 @@
+"""Structured decision trace of the refreshes of a config entry."""
+
+from __future__ import annotations
+
+from dataclasses import asdict, dataclass
+import datetime as dt
+from typing import Any
+
+
+@dataclass(slots=True)
+class DecisionRecord:
+    """Inputs and outcome of one refresh."""
+
+    time: dt.datetime
+    aim: dt.datetime | None
+    trigger: str
+    reasons: list[str] | None
+    sun_azimuth: float | None
+    sun_elevation: float | None
+    normal_branch: str | None
+    normal_clamp: str | None
+    normal_state: int | None
+    climate_inputs: dict[str, Any] | None = None
+    climate_branch: str | None = None
+    climate_clamp: str | None = None
+    climate_state: int | None = None
+    control_method: str | None = None
+    final_state: int | None = None
+    manual_override: list[str] | None = None
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the record as a JSON serializable dict."""
+        data = asdict(self)
+        data["time"] = self.time.isoformat()
+        data["aim"] = self.aim.isoformat() if self.aim is not None else None
+        return data
+
+
+class DecisionTrace:
+    """Fixed-size ring buffer of the most recent decision records."""
+
+    __slots__ = ("_records", "_next", "_count")
+
+    def __init__(self, size: int) -> None:  # noqa: D107
+        self._records: list[DecisionRecord | None] = [None] * size
+        self._next = 0
+        self._count = 0
+
+    def __len__(self) -> int:  # noqa: D105
+        return self._count
+
+    def append(self, record: DecisionRecord) -> None:
+        """Store a record, overwriting the oldest one when full."""
+        self._records[self._next] = record
+        self._next = (self._next + 1) % len(self._records)
+        self._count = min(self._count + 1, len(self._records))
+
+    def records(self) -> list[DecisionRecord]:
+        """Return the stored records, oldest first."""
+        size = len(self._records)
+        start = (self._next - self._count) % size
+        return [self._records[(start + i) % size] for i in range(self._count)]
+
+    def as_list(self) -> list[dict[str, Any]]:
+        """Return the stored records as dicts, oldest first."""
+        return [record.as_dict() for record in self.records()]
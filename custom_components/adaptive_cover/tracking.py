@@ -0,0 +1,107 @@
+"""Awaitable tracking of cover target positions."""
+
+from __future__ import annotations
+
+import asyncio
+from enum import StrEnum
+import time
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.event import async_call_later
+
+
+class TargetResult(StrEnum):
+    """Outcome of moving a cover to a target position."""
+
+    REACHED = "reached"
+    TIMEOUT = "timeout"
+    SUPERSEDED = "superseded"
+    CANCELLED = "cancelled"
+    FAILED = "failed"
+
+
+class TargetTracker:
+    """Future that resolves once a cover reaches its target position."""
+
+    __slots__ = (
+        "hass",
+        "entity_id",
+        "target",
+        "tolerance",
+        "future",
+        "start_position",
+        "expected",
+        "sent_at",
+        "finished_at",
+        "_unsub_timeout",
+    )
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        entity_id: str,
+        target: int,
+        tolerance: int,
+        timeout: float,
+    ) -> None:
+        """Start tracking, resolving with TIMEOUT after `timeout` seconds."""
+        self.hass = hass
+        self.entity_id = entity_id
+        self.target = target
+        self.tolerance = tolerance
+        self.future: asyncio.Future[TargetResult] = hass.loop.create_future()
+        self.start_position: int | None = None
+        self.expected: float | None = None
+        self.sent_at: float | None = None
+        self.finished_at: float | None = None
+        self._unsub_timeout = async_call_later(hass, timeout, self._async_timeout)
+
+    @callback
+    def _async_timeout(self, _now) -> None:
+        self._unsub_timeout = None
+        self.resolve(TargetResult.TIMEOUT)
+
+    def sent(
+        self, start_position: int | None, expected: float | None, timeout: float
+    ) -> None:
+        """Start timing the move once its command was sent.
+
+        The timeout restarts, so a cover that takes longer than `timeout`
+        from now on is reported as not reaching its target.
+        """
+        if self.future.done():
+            return
+        self.start_position = start_position
+        self.expected = expected
+        self.sent_at = time.monotonic()
+        if self._unsub_timeout is not None:
+            self._unsub_timeout()
+        self._unsub_timeout = async_call_later(self.hass, timeout, self._async_timeout)
+
+    @property
+    def elapsed(self) -> float | None:
+        """Seconds from sending the command until the tracker resolved."""
+        if self.sent_at is None or self.finished_at is None:
+            return None
+        return self.finished_at - self.sent_at
+
+    def update(self, position: int | None) -> bool:
+        """Check a reported position, resolving when it is close enough."""
+        if position is None or abs(position - self.target) > self.tolerance:
+            return False
+        self.resolve(TargetResult.REACHED)
+        return True
+
+    def resolve(self, result: TargetResult) -> None:
+        """Resolve the tracker, later calls are ignored."""
+        if self.future.done():
+            return
+        self.finished_at = time.monotonic()
+        self.future.set_result(result)
+        if self._unsub_timeout is not None:
+            self._unsub_timeout()
+            self._unsub_timeout = None
+
+    async def wait(self) -> TargetResult:
+        """Wait for the outcome without cancelling the tracker."""
+        return await asyncio.shield(self.future)
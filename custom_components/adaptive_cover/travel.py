@@ -0,0 +1,45 @@
+"""Learned travel time of covers."""
+
+from __future__ import annotations
+
+from dataclasses import asdict, dataclass
+
+from .const import TRAVEL_MIN_DISTANCE, TRAVEL_SMOOTHING
+
+
+@dataclass(slots=True)
+class TravelModel:
+    """Travel speed of one cover, learned from its completed moves."""
+
+    seconds_per_percent: float | None = None
+    samples: int = 0
+    stuck: int = 0
+
+    def observe(self, distance: int, elapsed: float) -> bool:
+        """Learn from a move of `distance` percent that took `elapsed` seconds."""
+        if distance < TRAVEL_MIN_DISTANCE or elapsed <= 0:
+            return False
+        speed = elapsed / distance
+        if self.seconds_per_percent is None:
+            self.seconds_per_percent = speed
+        else:
+            self.seconds_per_percent += TRAVEL_SMOOTHING * (
+                speed - self.seconds_per_percent
+            )
+        self.samples += 1
+        return True
+
+    def estimate(self, distance: int) -> float | None:
+        """Predict the seconds a move takes, None until a move was observed."""
+        if self.seconds_per_percent is None:
+            return None
+        return abs(distance) * self.seconds_per_percent
+
+    def as_dict(self) -> dict:
+        """Serialize the model."""
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, data: dict) -> TravelModel:
+        """Restore a serialized model."""
+        return cls(**data)